@@ -2,12 +2,17 @@
 
 """Distributed Morphology (DM) analyses with LaTeX report output."""
 
+import collections
+import concurrent.futures
+import functools
 import logging
+import time
 
 from .analysis import Analysis
 from .reporting import Report, texify
+from . import tools
 
-__all__ = ['Analysis', 'Report', 'calculate', 'texify']
+__all__ = ['Analysis', 'Report', 'calculate', 'calculate_many', 'texify']
 
 __title__ = 'dmengine'
 __version__ = '0.4.2.dev0'
@@ -18,15 +23,28 @@ __copyright__ = 'Copyright (c) 2011-2025 Sebastian Bank'
 
 logging.basicConfig(format='%(message)s', level=logging.INFO)
 
+log = logging.getLogger()
 
-def calculate(filename, *, directory=None, report=False, pdf=False, view=False):
-    """Return calculated DM analysis from the given config filename."""
-    analysis = Analysis(filename, directory=directory)
-    analysis.calculate()
-    analysis.save()
+
+def calculate(filename, *, directory=None, workers=None, cache=None, stream=False,
+              format='yaml', report=False, split_log=False, pdf=False, view=False):
+    """Return calculated DM analysis from the given config filename.
+
+    With stream, each worklog entry is saved as soon as it is calculated (not kept).
+    format is the results format ('yaml', 'jsonl', 'msgpack'). With split_log,
+    the report log of each paradigm is saved into its own file.
+    """
+    analysis = Analysis(filename, directory=directory, workers=workers, cache=cache,
+                        format=format)
+    if stream:
+        analysis.stream()
+    else:
+        analysis.calculate()
+        analysis.save()
 
     if report or pdf or view:
-        report = Report(analysis.results)
+        report = Report(analysis.results if stream else analysis,
+                        workers=workers, split_log=split_log)
         report.save()
 
         if pdf or view:
@@ -35,3 +53,38 @@ def calculate(filename, *, directory=None, report=False, pdf=False, view=False):
         analysis.report = report
 
     return analysis
+
+
+Result = collections.namedtuple('Result', ['filename', 'seconds', 'error'])
+
+
+def calculate_many(patterns, *, directory=None, workers=None, cache=None, stream=False,
+                   format='yaml', report=False, split_log=False, pdf=False, view=False):
+    """Yield a result for each DM analysis from the given config filenames or glob patterns.
+
+    With several files and workers, the files are calculated in a pool of workers
+    processes, otherwise the inputs of each file. Errors are logged and returned.
+    """
+    filenames = tools.expand_globs(patterns)
+    kwargs = {'directory': directory, 'cache': cache, 'stream': stream, 'format': format,
+              'report': report, 'split_log': split_log, 'pdf': pdf, 'view': view}
+
+    if workers is not None and workers > 1 and len(filenames) > 1:
+        calculate_file = functools.partial(_calculate_file, **kwargs)
+        with concurrent.futures.ProcessPoolExecutor(min(workers, len(filenames))) as pool:
+            yield from pool.map(calculate_file, filenames)
+    else:
+        for filename in filenames:
+            yield _calculate_file(filename, workers=workers, **kwargs)
+
+
+def _calculate_file(filename, **kwargs):
+    start = time.perf_counter()
+    try:
+        calculate(filename, **kwargs)
+    except Exception as e:
+        log.exception(f'{filename!r} failed')
+        error = f'{e.__class__.__name__}: {e}'
+    else:
+        error = None
+    return Result(filename, time.perf_counter() - start, error)
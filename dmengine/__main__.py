@@ -4,7 +4,8 @@ import argparse
 import os
 import sys
 
-from . import __version__, calculate
+from . import __version__, calculate_many
+from .watch import Watcher
 
 __all__ = ['main']
 
@@ -12,26 +13,81 @@ __all__ = ['main']
 def main():
     """Execute the command-line interface."""
     parser = argparse.ArgumentParser(prog='dmengine',
-        description='Calculates a given Distributed Morphology (DM) analysis')
+        description='Calculates the given Distributed Morphology (DM) analyses',
+        epilog='A last argument without .yaml/.yml suffix is the results output directory.')
 
     parser.add_argument('--version', action='version',
                         version='%%(prog)s %s' % _version())
 
-    parser.add_argument('filename',
-                        help='dm analysis .yaml definition file')
+    parser.add_argument('filename', nargs='+',
+                        help='dm analysis .yaml definition file or glob pattern')
     parser.add_argument('directory', nargs='?',
-                        help='analysis results output directory')
+                        help='analysis results output directory'
+                             ' (last argument without .yaml/.yml suffix)')
+
+    parser.add_argument('--jobs', dest='workers', metavar='N', type=int,
+                        help='calculate the files (or the inputs and report paradigms'
+                             ' of a single file) in N worker processes')
+
+    parser.add_argument('--cache', dest='cache', metavar='DIR',
+                        help='reuse (and store) the results of unchanged inputs in DIR')
+
+    parser.add_argument('--stream', dest='stream', action='store_true',
+                        help='save each worklog entry as soon as it is calculated'
+                             ' (lower memory use)')
+
+    parser.add_argument('--format', dest='format', metavar='FORMAT',
+                        choices=['yaml', 'jsonl', 'msgpack'], default='yaml',
+                        help='results file format: yaml (default), jsonl, msgpack')
+
+    parser.add_argument('--watch', dest='watch', action='store_true',
+                        help='recalculate (single file) whenever it changes')
 
     parser.add_argument('--report', dest='report', action='store_true',
                         help='create a LaTeX report from the results')
+    parser.add_argument('--split-log', dest='split_log', action='store_true',
+                        help='save the report log of each paradigm into its own file')
     parser.add_argument('--pdf', dest='pdf', action='store_true',
                         help='render the report to PDF (implies --report)')
     parser.add_argument('--view', dest='view', action='store_true',
                         help='open the report in viewer app (implies --pdf)')
 
     args = parser.parse_args()
-    calculate(args.filename, directory=args.directory,
-              report=args.report, pdf=args.pdf, view=args.view)
+    filenames, directory = args.filename, args.directory
+    if directory is None and len(filenames) > 1 and not _is_config(filenames[-1]):
+        *filenames, directory = filenames
+
+    if args.watch:
+        if len(filenames) != 1:
+            parser.error('--watch requires a single filename')
+        if args.stream:
+            parser.error('--watch keeps the worklog in memory, it cannot be used with --stream')
+        watcher = Watcher(filenames[0], directory=directory, workers=args.workers,
+                          cache=args.cache, format=args.format,
+                          report=args.report, split_log=args.split_log,
+                          pdf=args.pdf or args.view)
+        try:
+            watcher.run()
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    results = calculate_many(filenames, directory=directory, workers=args.workers,
+                             cache=args.cache, stream=args.stream, format=args.format,
+                             report=args.report, split_log=args.split_log,
+                             pdf=args.pdf, view=args.view)
+    failed = 0
+    for r in results:
+        if r.error is None:
+            print(f'ok      {r.filename} ({r.seconds:.2f}s)')
+        else:
+            failed += 1
+            print(f'FAILED  {r.filename} ({r.seconds:.2f}s) {r.error}')
+    return 1 if failed else 0
+
+
+def _is_config(filename):
+    return filename.lower().endswith(('.yaml', '.yml'))
 
 
 def _version():
@@ -41,4 +97,4 @@ def _version():
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -3,11 +3,12 @@
 import collections
 import logging
 
-import yaml
-
+from . import cache
 from . import calculation
 from . import features
+from . import meta
 from . import readjustments
+from . import results
 from . import rules
 from . import tools
 from . import types
@@ -32,29 +33,52 @@ class Analysis(object):
 
     Calculator = calculation.Calculator
 
-    def __init__(self, filename, *, directory=None, encoding='utf-8'):
+    Cache = cache.ResultCache
+
+    Format = results.ResultsFormat
+
+    stages = [('rules', {'rules'}),
+              ('insertion', {'vis', 'insertion', 'matcher'}),
+              ('readjustments', {'readjustments'})]
+
+    def __init__(self, filename, *, directory=None, workers=None, cache=None,
+                 format='yaml', encoding='utf-8'):
         self.filename = filename
+        self.format = self.Format(format)
         self.results = tools.derive_filename(filename,
                                              suffix='-results',
-                                             extension='yaml',
+                                             extension=self.format.extension,
                                              directory=directory)
+        self.workers = workers
+        self.cache = self.Cache(cache) if cache is not None else None
+        self.encoding = encoding
 
         log.info(f'{self!r}')
 
-        with open(self.filename, encoding=encoding) as fd:
-            cfg = yaml.safe_load(fd)
+        self.configure(self.load_config())
+
+    def load_config(self):
+        with open(self.filename, encoding=self.encoding) as fd:
+            return meta.load(fd)
 
+    def configure(self, cfg, *, reuse=()):
+        """Set up the analysis from cfg keeping the components named in reuse."""
         self.author = cfg.get('author', 'Anomymous')
         self.title = cfg.get('title', 'DM-Analyis')
 
-        self.features = self.Features(cfg['features'],
-                                      always_bag=cfg.get('multisets'))
+        if 'features' not in reuse:
+            self.features = self.Features(cfg['features'],
+                                          always_bag=cfg.get('multisets'))
 
-        self.vis = self.Vis(cfg['vis'])
+        if 'vis' not in reuse:
+            self.vis = self.Vis(cfg['vis'], system=self.features)
 
-        self.rules = self.Rules(cfg.get('rules', []))
+        if 'rules' not in reuse:
+            self.rules = self.Rules(cfg.get('rules', []), system=self.features)
 
-        self.readjustments = self.Readjustments(cfg.get('readjustments', []))
+        if 'readjustments' not in reuse:
+            self.readjustments = self.Readjustments(cfg.get('readjustments', []),
+                                                    system=self.features)
 
         self.paradigms = [collections.OrderedDict([
             ('name', p['name']),
@@ -64,22 +88,89 @@ class Analysis(object):
         ]) for p in cfg['paradigms']]
 
         inputs = (i for p in self.paradigms for i in p['inputs'])
-        self.inputs = list(map(SlotList.from_heads, inputs))
+        self.inputs = [SlotList.from_heads(i, system=self.features) for i in inputs]
 
         self.calculator = self.Calculator(cfg.get('insertion', 'cyclic'),
-            self.inputs, self.rules, self.vis, self.readjustments)
+            self.inputs, self.rules, self.vis, self.readjustments,
+            system=self.features, workers=self.workers, matcher=cfg.get('matcher'))
+
+        self.cfg = cfg
 
     def __repr__(self):
         return f'{self.__class__.__name__}({self.filename!r})'
 
-    def calculate(self):
+    def calculate(self, *, previous=None, start='rules'):
         log.info('\tcalculate..')
-        self.worklog, self.outputs, self.spellouts = self.calculator()
+        self.worklog = list(self.iterworklog(previous=previous, start=start))
+        self.outputs = [entry['output_pst'] for entry in self.worklog]
+        self.spellouts = [entry['spellout'] for entry in self.worklog]
+
+    def iterworklog(self, *, previous=None, start='rules'):
+        """Yield the worklog entry of each input as soon as it is calculated."""
+        if self.cache is not None and previous is None:
+            previous, start = self.cache.load(self), None
+            log.info(f'\t{len(previous)} cached inputs from {self.cache!r}')
+
+        worklog = self.calculator.iterlogs(previous=previous, start=start)
+
+        if self.cache is not None:
+            worklog = self.cache.storing(self, worklog)
+        return worklog
+
+    def reload(self):
+        """Reload the config file and recalculate what changed, return the changed keys.
+
+        Worklog entries of unchanged inputs are reused from the stage (rules,
+        insertion, readjustments) of the first changed component on.
+        If the recalculation fails, the next reload recalculates everything.
+        """
+        log.info(f'\treload {self.filename!r}..')
+        cfg = self.load_config()
+        changed = {k for k in self.cfg.keys() | cfg.keys() if self.cfg.get(k) != cfg.get(k)}
+
+        worklog = getattr(self, 'worklog', None)
+        self.worklog = None  # until calculated for cfg
+        if worklog is None or changed & {'features', 'multisets'}:
+            self.configure(cfg)
+            self.calculate()
+            return changed
+
+        reuse = {'features'} | {k for k in ('vis', 'rules', 'readjustments') if k not in changed}
+        self.configure(cfg, reuse=reuse)
+        start = next((stage for stage, keys in self.stages if changed & keys), None)
+        previous = {self.calculator.input_key(e['input_pre']): e for e in worklog}
+        self.calculate(previous=previous, start=start)
+        return changed
 
     def save(self, *, encoding='utf-8', newline=''):
         log.info(f'\tsave to {self.results!r}..')
 
-        data = collections.OrderedDict([
+        with self.format.open(self.results, 'w', encoding=encoding, newline=newline) as fd:
+            self.format.dump(self._results(), self.worklog, fd, anchored=self.vis)
+
+    def stream(self, *, encoding='utf-8', newline=''):
+        """Calculate and save the results, writing each worklog entry when calculated.
+
+        The worklog is not kept (only the spellouts), the file has the same
+        structure as from save() (YAML: all vis are anchored).
+        """
+        log.info(f'\tcalculate and save to {self.results!r}..')
+
+        self.spellouts = spellouts = []
+        with self.format.open(self.results, 'w', encoding=encoding, newline=newline) as fd:
+            with self.format.writer(fd, self._results(), anchored=self.vis) as stream:
+                for entry in self.iterworklog():
+                    stream.write(entry)
+                    spellouts.append(entry['spellout'])
+
+    def plain(self):
+        """Return the results as plain values (as loaded from the saved results file)."""
+        data = self._results()
+        data['worklog'] = self.worklog
+        return meta.plain(data)
+
+    def _results(self):
+        return collections.OrderedDict([
             ('author', self.author),
             ('title', self.title),
             ('insertion', self.calculator.insertion.kind),
@@ -89,19 +180,25 @@ class Analysis(object):
             ('rules', self.rules),
             ('readjustments', self.readjustments),
             ('paradigms', self.paradigms),
-            ('worklog', self.worklog),
         ])
 
-        with open(self.results, 'w', encoding=encoding, newline=newline) as fd:
-            yaml.dump(data, fd)
-
 
 class SlotList(types.FlowList):
     """Hierarchy of potentially fused heads represented as sequence."""
 
     @classmethod
-    def from_heads(cls, heads):
-        return cls(Slot([Head(h)]) for h in heads)
+    def from_heads(cls, heads, *, system):
+        head = system.bind(Head)
+        return cls(Slot([head(h)]) for h in heads)
+
+    def copy_slots(self):
+        """Return a copy with new slots sharing the (copy-on-write) heads."""
+        return self.__class__(slot.__class__(slot) for slot in self)
+
+    def features(self):
+        """Return the union of the features of all heads (None if there are none)."""
+        heads = [head for slot in self for head in slot]
+        return heads[0].from_featuresets(heads) if heads else None
 
     def __str__(self):
         return ' '.join(map(str, self))
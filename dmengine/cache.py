@@ -0,0 +1,70 @@
+"""Cache worklog entries on disk by hash of the analysis config and of the input."""
+
+import hashlib
+import json
+import os
+import tempfile
+
+from . import pickling
+
+__all__ = ['ResultCache']
+
+
+class ResultCache(object):
+    """Directory of pickled worklog entries, one subdirectory per config hash."""
+
+    defaults: dict[str, object] = {'features': None, 'multisets': False, 'insertion': 'cyclic',
+                                   'vis': None, 'rules': [], 'readjustments': []}
+
+    suffix = '.pickle'
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.directory!r})'
+
+    def config_hash(self, cfg):
+        """Return the hash of the config parts determining the results (and the version)."""
+        from . import __version__
+
+        data = {k: cfg.get(k, d) for k, d in self.defaults.items()}
+        data['version'] = __version__
+        data = json.dumps(data, sort_keys=True, default=str)
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def input_hash(input_key):
+        return hashlib.sha256(repr(input_key).encode('utf-8')).hexdigest()
+
+    def _paths(self, analysis):
+        directory = os.path.join(self.directory, self.config_hash(analysis.cfg))
+        for input_pre in analysis.inputs:
+            key = analysis.calculator.input_key(input_pre)
+            yield key, os.path.join(directory, self.input_hash(key) + self.suffix)
+
+    def load(self, analysis):
+        """Return the cached worklog entries for the inputs of analysis by input key."""
+        result = {}
+        for key, path in self._paths(analysis):
+            if key in result:
+                continue
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            except FileNotFoundError:
+                continue
+            result[key] = pickling.loads(data, features=analysis.features, vis=analysis.vis)
+        return result
+
+    def storing(self, analysis, worklog):
+        """Yield the entries of worklog for the inputs of analysis, saving uncached ones."""
+        for (key, path), entry in zip(self._paths(analysis), worklog):
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                data = pickling.dumps(entry, vis=analysis.vis)
+                with tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(path),
+                                                 suffix='.tmp', delete=False) as f:
+                    f.write(data)
+                os.replace(f.name, path)
+            yield entry
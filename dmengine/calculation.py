@@ -1,8 +1,12 @@
 """Calculate the outputs for rules, vocabulary item insertion, readjustments."""
 
+import collections
+import concurrent.futures
 import logging
 
 from . import insertion
+from . import meta
+from . import pickling
 
 __all__ = ['Calculator']
 
@@ -15,45 +19,214 @@ class Calculator(object):
 
     Insertion = insertion.Insertion
 
-    def __init__(self, insertion, inputs, rules, vis, readjustments):
-        self.insertion = self.Insertion(insertion, vis)
-        self.inputs = inputs
-        self.rules = Rules(rules)
-        self.readjustments = Readjustments(readjustments)
-
-    def __call__(self):
-        self.logs = logs = []
-        self.outputs = outputs = []
-        self.spellouts = spellouts = []
+    chunks_per_worker = 4
 
-        for input_pre in self.inputs:
-            log.debug(f'-- \n{input_pre}')
+    max_chunk_size = 64
 
-            input_pro, input_pst = self.rules(input_pre)
+    pending_per_worker = 2
 
-            matches, inserts, output_pre = self.insertion(input_pst)
+    memoize = True
 
-            output_pro, output_pst = self.readjustments(output_pre)
-
-            spellout = output_pst.exponents.spellout
+    def __init__(self, insertion, inputs, rules, vis, readjustments, *,
+                 system, workers=None, matcher=None):
+        self.system = system
+        self.insertion = self.Insertion(insertion, vis, matcher=matcher)
+        self.inputs = inputs
+        self.rules = Rules(rules)
+        self.readjustments = Readjustments(readjustments)
+        self.workers = workers
 
-            log.debug('"{}"'.format(spellout.encode('ascii', 'backslashreplace')))
-            logs.append({'input_pre': input_pre,
-                         'input_pro': input_pro,
-                         'input_pst': input_pst,
-                         'matches': matches,
-                         'inserts': inserts,
-                         'output_pre': output_pre,
-                         'output_pro': output_pro,
-                         'output_pst': output_pst,
-                         'spellout': spellout})
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['inputs'] = []
+        for name in ('logs', 'outputs', 'spellouts'):
+            state.pop(name, None)
+        return state
 
-            outputs.append(output_pst)
+    def __call__(self, *, previous=None, start='rules'):
+        """Return logs, outputs, spellouts of all inputs.
 
-            spellouts.append(spellout)
+        previous maps input_key() to a log entry to recalculate from the start
+        stage ('rules', 'insertion', 'readjustments', None: reuse unchanged).
+        """
+        self.logs = logs = list(self.iterlogs(previous=previous, start=start))
+        self.outputs = outputs = [entry['output_pst'] for entry in logs]
+        self.spellouts = spellouts = [entry['spellout'] for entry in logs]
 
         return logs, outputs, spellouts
 
+    def iterlogs(self, *, previous=None, start='rules'):
+        """Yield the log entry of each input in order as soon as it is calculated."""
+        inputs, positions = self.inputs, None
+        if self.memoize:
+            inputs, positions = self.unique_inputs(inputs)
+
+        reused = {}
+        if previous:
+            for i, input_pre in enumerate(inputs):
+                entry = previous.get(self.input_key(input_pre))
+                if entry is not None:
+                    reused[i] = entry
+        todo_inputs = [input_pre for i, input_pre in enumerate(inputs) if i not in reused]
+
+        self.insertion.prepare(todo_inputs)
+
+        if self.workers is not None and self.workers > 1 and todo_inputs:
+            new = self.calculate_parallel(todo_inputs, self.workers)
+        else:
+            new = map(self.calculate, todo_inputs)
+
+        logs = (self.recalculate(reused[i], start) if i in reused else next(new)
+                for i in range(len(inputs)))
+
+        if positions is not None:
+            logs = self.expand_logs(logs, positions)
+
+        yield from logs
+        next(new, None)  # finish (shutting down the worker pool)
+
+    @staticmethod
+    def input_key(slots):
+        """Return a hashable canonical form of the feature values in slots."""
+        return tuple(tuple((tuple(head.values), head.hidden) for head in slot)
+                     for slot in slots)
+
+    def unique_inputs(self, inputs):
+        """Return the first of each identical inputs and the positions for all inputs."""
+        unique, positions, keys = [], [], {}
+        for input_pre in inputs:
+            key = self.input_key(input_pre)
+            if key not in keys:
+                keys[key] = len(unique)
+                unique.append(input_pre)
+            positions.append(keys[key])
+        return unique, positions
+
+    def expand_logs(self, logs, positions):
+        """Yield logs for all positions, repeated logs are copied (keeping their structure).
+
+        logs are consumed lazily, each is kept only until its last repetition.
+        """
+        shared = {id(vi) for vi in self.insertion.vis}
+
+        logs = iter(logs)
+        last = {pos: i for i, pos in enumerate(positions)}
+        seen = {}
+        for i, pos in enumerate(positions):
+            if pos in seen:
+                entry = copy_structure(seen[pos], shared)
+            else:
+                entry = seen[pos] = next(logs)
+            if last[pos] == i:
+                del seen[pos]
+            yield entry
+
+    def calculate(self, input_pre):
+        log.debug(f'-- \n{input_pre}')
+
+        input_pro, input_pst = self.rules(input_pre)
+
+        matches, inserts, output_pre = self.insertion(input_pst.copy())
+
+        output_pro, output_pst = self.readjustments(output_pre)
+
+        spellout = output_pst.exponents.spellout
+
+        log.debug('"{}"'.format(spellout.encode('ascii', 'backslashreplace')))
+        return {'input_pre': input_pre,
+                'input_pro': input_pro,
+                'input_pst': input_pst,
+                'matches': matches,
+                'inserts': inserts,
+                'output_pre': output_pre,
+                'output_pro': output_pro,
+                'output_pst': output_pst,
+                'spellout': spellout}
+
+    def recalculate(self, entry, start):
+        """Return log entry recalculated from the given stage on (None: entry unchanged)."""
+        if start is None:
+            return entry
+        elif start == 'rules':
+            return self.calculate(entry['input_pre'])
+
+        entry = dict(entry)
+        if start == 'insertion':
+            entry['matches'], entry['inserts'], entry['output_pre'] = \
+                self.insertion(entry['input_pst'].copy())
+        elif start != 'readjustments':
+            raise ValueError(f'unknown stage: {start!r}')
+
+        entry['output_pro'], entry['output_pst'] = self.readjustments(entry['output_pre'])
+        entry['spellout'] = entry['output_pst'].exponents.spellout
+        return entry
+
+    def calculate_parallel(self, inputs, workers):
+        """Yield the logs for inputs calculated in chunks across a pool of worker processes.
+
+        Chunks have at most max_chunk_size inputs, at most pending_per_worker chunks
+        per worker are submitted and not yet yielded (bounding memory when streaming).
+        """
+        system = self.system
+        vis = self.insertion.vis
+
+        n_chunks = workers * self.chunks_per_worker
+        size = min(max(1, -(-len(inputs) // n_chunks)), self.max_chunk_size)
+        chunks = (pickling.dumps(inputs[i:i + size]) for i in range(0, len(inputs), size))
+
+        pool = concurrent.futures.ProcessPoolExecutor(workers, initializer=_init_worker,
+                                                      initargs=(system, pickling.dumps(self)))
+        window = workers * self.pending_per_worker
+        with pool:
+            pending = collections.deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_calculate_chunk, chunk))
+                if len(pending) >= window:
+                    data = pending.popleft().result()
+                    yield from pickling.loads(data, features=system, vis=vis)
+            while pending:
+                data = pending.popleft().result()
+                yield from pickling.loads(data, features=system, vis=vis)
+
+
+def copy_structure(obj, shared, memo=None):
+    """Return a copy of the lists and dicts in obj, sharing value types and the shared ids.
+
+    Other objects (e.g. vis copied by readjustments) are copied, objects occurring
+    repeatedly in obj are copied once (so the copy has the same aliases in the results).
+    """
+    if isinstance(obj, (str, *meta.Dumper.value_types)) or id(obj) in shared:
+        return obj
+    if memo is None:
+        memo = {}
+    elif id(obj) in memo:
+        return memo[id(obj)]
+
+    if isinstance(obj, dict):
+        result = obj.__class__((k, copy_structure(v, shared, memo)) for k, v in obj.items())
+    elif isinstance(obj, list):
+        result = obj.__class__(copy_structure(o, shared, memo) for o in obj)
+    else:
+        result = obj.copy()
+    memo[id(obj)] = result
+    return result
+
+
+_worker = None
+
+
+def _init_worker(system, calculator):
+    global _worker
+    calculator = pickling.loads(calculator, features=system)
+    _worker = system, calculator
+
+
+def _calculate_chunk(inputs):
+    system, calculator = _worker
+    inputs = pickling.loads(inputs, features=system)
+    logs = list(map(calculator.calculate, inputs))
+    return pickling.dumps(logs, vis=calculator.insertion.vis)
+
 
 class Executor(object):
     """Sequentially compute outputs for each rule to the given input item."""
@@ -63,14 +236,25 @@ class Executor(object):
     def __init__(self, rules):
         self.rules = rules
 
+    @staticmethod
+    def copy(item):
+        return item.copy()
+
+    @staticmethod
+    def present(item):
+        return None
+
     def __call__(self, item):
         outputs = self.Outputs()
+        present = self.present(item)
 
         for r in self.rules:
-            copy = item.copy()
-            if r(copy):
-                item = copy
-                log.debug(f' {r}\n{item}')
+            if present is None or r.possible(present):
+                copy = self.copy(item)
+                if r(copy):
+                    item = copy
+                    present = self.present(item)
+                    log.debug(f' {r}\n{item}')
 
             outputs.append(item)
 
@@ -80,7 +264,19 @@ class Executor(object):
 
 
 class Rules(Executor):
-    """Execute pre-insertion rules on hierarchies of heads."""
+    """Execute pre-insertion rules on hierarchies of heads.
+
+    Snapshots share the heads, rules replace heads they change by a copy.
+    Rules are skipped if the features they require are not present at all.
+    """
+
+    @staticmethod
+    def copy(item):
+        return item.copy_slots()
+
+    @staticmethod
+    def present(item):
+        return item.features()
 
 
 class Readjustments(Executor):
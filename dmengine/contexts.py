@@ -8,13 +8,97 @@ InsertContext
 """
 
 import collections
-from itertools import chain
+from itertools import chain, islice
 
 from . import features
 from . import meta
 from . import types
 
-__all__ = ['Context', 'Contexts']
+__all__ = ['SlotsFeatures', 'HeadPosition', 'Context', 'Contexts']
+
+
+class SlotsFeatures(object):
+    """Union of the features of all heads in slots, cached until any feature set is changed."""
+
+    __slots__ = ('slots', 'generation', 'features')
+
+    def __init__(self, slots):
+        self.slots = slots
+        self.generation = None
+        self.features = None
+
+    def __call__(self):
+        generation = features.FeatureSet.generation
+        if generation != self.generation:
+            heads = list(chain.from_iterable(self.slots))
+            self.features = heads[0].from_featuresets(heads)
+            self.generation = generation
+        return self.features
+
+
+class HeadPosition(object):
+    """Head in a sequence of slots with lazy access to the heads around it (no copying).
+
+    The positions of one iteration share all_features(), slots are assumed not to
+    gain or lose heads while iterating (rules changing them stop iterating).
+    """
+
+    __slots__ = ('slots', 'i_s', 'i_h', 'head', 'all_features')
+
+    @classmethod
+    def iterslots(cls, slots, all_features=None):
+        if all_features is None:
+            all_features = SlotsFeatures(slots)
+        for i_s, slot in enumerate(slots):
+            for i_h, head in enumerate(slot):
+                yield cls(slots, i_s, i_h, head, all_features)
+
+    @classmethod
+    def iterslot(cls, slots, i_s, all_features=None):
+        if all_features is None:
+            all_features = SlotsFeatures(slots)
+        for i_h, head in enumerate(slots[i_s]):
+            yield cls(slots, i_s, i_h, head, all_features)
+
+    def __init__(self, slots, i_s, i_h, head, all_features):
+        self.slots = slots
+        self.i_s = i_s
+        self.i_h = i_h
+        self.head = head
+        self.all_features = all_features
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}({self.slots!r},'
+                f' i_s={self.i_s!r}, i_h={self.i_h!r})')
+
+    @property
+    def slot(self):
+        return self.slots[self.i_s]
+
+    def left_heads(self):
+        """Heads of the left-adjacent (inner) slot."""
+        return self.slots[self.i_s - 1] if self.i_s else ()
+
+    def right_heads(self):
+        """Heads of the right-adjacent (outer) slot."""
+        i_s = self.i_s + 1
+        return self.slots[i_s] if i_s < len(self.slots) else ()
+
+    def up_heads(self):
+        """Other heads fused into the same slot."""
+        slot = self.slots[self.i_s]
+        return chain(islice(slot, self.i_h), islice(slot, self.i_h + 1, None))
+
+    def other_heads(self):
+        """All heads but this one."""
+        slots, i_s = self.slots, self.i_s
+        return chain(chain.from_iterable(islice(slots, i_s)),
+                     self.up_heads(),
+                     chain.from_iterable(islice(slots, i_s + 1, None)))
+
+    def all_heads(self):
+        """All heads including this one."""
+        return chain.from_iterable(self.slots)
 
 
 class Context(metaclass=meta.FactoryMeta('scope', collections.OrderedDict)):  # type: ignore[metaclass]  # noqa: E501
@@ -22,8 +106,8 @@ class Context(metaclass=meta.FactoryMeta('scope', collections.OrderedDict)):  #
 
     Features = features.FeatureSet
 
-    def __init__(self, features):
-        self.features = self.Features(features)
+    def __init__(self, features, *, system):
+        self.features = system.bind(self.Features)(features)
         if not self.features:
             raise ValueError(f'{self!r} empty features.')
 
@@ -31,18 +115,24 @@ class Context(metaclass=meta.FactoryMeta('scope', collections.OrderedDict)):  #
         features = str(self.features)
         return f'Context(scope={self.scope!r}, features={features!r})'
 
-    def match(self, head, left_context, right_context, up_context):
+    cost = 0
+
+    def match(self, position):
         raise NotImplementedError
 
+    def compile(self):
+        """Return a function of a position equivalent to match (with the features as of now)."""
+        return self.match
+
 
 class Contexts(types.Instances):
     """List of contexts created in preconfigured order."""
 
     new_item = Context
 
-    def __init__(self, **kwcontexts):
+    def __init__(self, *, system, **kwcontexts):
         scopes = iter(self.new_item.subclasses)
-        items = (self.new_item(s, kwcontexts[s])
+        items = (self.new_item(s, kwcontexts[s], system=system)
                  for s in scopes if s in kwcontexts)
         super(types.Instances, self).__init__(items)
 
@@ -69,11 +159,17 @@ class ThisHead(HeadContext):
 
     scope = 'this_head'
 
+    cost = 1
+
     def __str__(self):
         return f'[__,{self.features}]'
 
-    def match(self, head, left_context, right_context, up_context):
-        return self.features.issubset(head)
+    def match(self, position):
+        return self.features.issubset(position.head)
+
+    def compile(self):
+        test = self.features.subset_test()
+        return lambda position: test(position.head)
 
 
 class LeftHead(HeadContext):
@@ -81,12 +177,17 @@ class LeftHead(HeadContext):
 
     scope = 'left_head'
 
+    cost = 2
+
     def __str__(self):
         return f'[{self.features}][__]'
 
-    def match(self, head, left_context, right_context, up_context):
-        return (left_context
-                and any(map(self.features.issubset, left_context[-1])))
+    def match(self, position):
+        return any(map(self.features.issubset, position.left_heads()))
+
+    def compile(self):
+        test = self.features.subset_test()
+        return lambda position: any(map(test, position.left_heads()))
 
 
 class RightHead(HeadContext):
@@ -94,12 +195,17 @@ class RightHead(HeadContext):
 
     scope = 'right_head'
 
+    cost = 2
+
     def __str__(self):
         return f'[__][{self.features}]'
 
-    def match(self, head, left_context, right_context, up_context):
-        return (right_context
-                and any(map(self.features.issubset, right_context[0])))
+    def match(self, position):
+        return any(map(self.features.issubset, position.right_heads()))
+
+    def compile(self):
+        test = self.features.subset_test()
+        return lambda position: any(map(test, position.right_heads()))
 
 
 class OtherHead(HeadContext):
@@ -107,13 +213,17 @@ class OtherHead(HeadContext):
 
     scope = 'other_head'
 
+    cost = 4
+
     def __str__(self):
         return f'__...[{self.features}]'
 
-    def match(self, head, left_context, right_context, up_context):
-        contexts = left_context + [up_context] + right_context
-        other_heads = chain.from_iterable(contexts)
-        return any(map(self.features.issubset, other_heads))
+    def match(self, position):
+        return any(map(self.features.issubset, position.other_heads()))
+
+    def compile(self):
+        test = self.features.subset_test()
+        return lambda position: any(map(test, position.other_heads()))
 
 
 class AnyHead(HeadContext):
@@ -121,13 +231,17 @@ class AnyHead(HeadContext):
 
     scope = 'any_head'
 
+    cost = 4
+
     def __str__(self):
         return f'[{self.features}]'
 
-    def match(self, head, left_context, right_context, up_context):
-        contexts = left_context + [[head]] + [up_context] + right_context
-        all_heads = chain.from_iterable(contexts)
-        return any(map(self.features.issubset, all_heads))
+    def match(self, position):
+        return any(map(self.features.issubset, position.all_heads()))
+
+    def compile(self):
+        test = self.features.subset_test()
+        return lambda position: any(map(test, position.all_heads()))
 
 
 class Anywhere(HeadContext):
@@ -135,14 +249,17 @@ class Anywhere(HeadContext):
 
     scope = 'anywhere'
 
+    cost = 3
+
     def __str__(self):
         return f'{self.features}'
 
-    def match(self, head, left_context, right_context, up_context):
-        contexts = left_context + [[head]] + [up_context] + right_context
-        all_heads = chain.from_iterable(contexts)
-        all_features = self.features.from_featuresets(all_heads)
-        return self.features.issubset(all_features)
+    def match(self, position):
+        return self.features.issubset(position.all_features())
+
+    def compile(self):
+        test = self.features.subset_test()
+        return lambda position: test(position.all_features())
 
 
 class InsertContext(Context):
@@ -154,7 +271,7 @@ class LastInsert(InsertContext):
 
     scope = 'last_insert'
 
-    def match(self, head, left_context, right_context, up_context):
+    def match(self, position):
         raise NotImplementedError
 
 
@@ -163,5 +280,5 @@ class AnyInsert(InsertContext):
 
     scope = 'any_insert'
 
-    def match(self, head, left_context, right_context, up_context):
+    def match(self, position):
         raise NotImplementedError
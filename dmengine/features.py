@@ -1,13 +1,10 @@
 """Sets and multisets (bags) of predefined morphosyntactic feature values."""
 
 import collections
-from collections.abc import Container
 import functools
-from itertools import chain, groupby
+from itertools import count, groupby
 import operator
 
-from dmengine.vendor import oset
-
 from . import meta
 from . import tools
 
@@ -17,7 +14,7 @@ __all__ = ['FeatureSystem', 'FeatureSet', 'FeatureBag']
 # TODO: refactor this module
 
 class FeatureMeta(type):
-    """Retrieve from last created feature system as default."""
+    """Retrieve features by value from the feature system of the class."""
 
     system = None
 
@@ -63,6 +60,7 @@ class Feature(metaclass=FeatureMeta):
 
 
 class FeatureSetMeta(type):
+    """Create feature sets from values in the feature system of the class."""
 
     system = None
 
@@ -70,19 +68,42 @@ class FeatureSetMeta(type):
         if isinstance(values, self):
             return values.copy()
 
+        if not isinstance(values, str):
+            values = tuple(values)
+        interned = self.system.interned
+        key = self, sortkey, values
+        try:
+            return interned[key]
+        except KeyError:
+            pass
+
         if isinstance(values, str):
             values = values.replace(',', ' ').split()
         keys = map(self.system.get_key, values)
-        features = (f() for f in map(self.system.mapping.__getitem__, keys))
-        features = sorted(features, key=sortkey)
-        return super().__call__(features)
+        features = sorted(map(self.system.mapping.__getitem__, keys), key=sortkey)
+        result = interned[key] = self._intern(tuple(features))
+        return result
 
 
+@meta.value_type
 @meta.serializable
 class FeatureSet(metaclass=FeatureSetMeta):
-    """Ordered set of morphosyntactic features."""
+    """Ordered set of morphosyntactic features held as bitmask integers.
+
+    Each feature of the system owns the bit at its index: ``bits`` holds the
+    members, ``hidden`` the consumed ones, ``order`` the feature classes in
+    insertion order (for output). ``generation`` counts changes of any set.
+
+    Sets created from values are interned per feature system: the same values
+    give the same frozen instance, use copy() for a mutable one. Use the classes
+    bound to a feature system (FeatureSystem.bind()).
+    """
+
+    generation = 0
 
-    features: type[Container] = oset.oset
+    _generations = count(1)
+
+    frozen = False
 
     @staticmethod
     def _multi_representer(dumper, self):
@@ -94,130 +115,257 @@ class FeatureSet(metaclass=FeatureSetMeta):
 
     @classmethod
     def from_featuresets(cls, featuresets):
-        features = chain.from_iterable(fs.features for fs in featuresets)
-        return cls.from_features(features)
+        result = cls._from_bits((), 0)
+        for fs in featuresets:
+            result._add(fs)
+        return result
+
+    @classmethod
+    def _intern(cls, order):
+        interned = cls.system.interned
+        result = interned.get((cls, order))
+        if result is None:
+            result = cls._from_order(order)
+            result.frozen = True
+            result = interned.setdefault((cls, result.order), result)
+        return result
+
+    @classmethod
+    def _from_bits(cls, order, bits, hidden=0):
+        inst = object.__new__(cls)
+        inst.order = order
+        inst.bits = bits
+        inst.hidden = hidden
+        return inst
+
+    @classmethod
+    def _from_order(cls, order):
+        order = tuple(tools.uniqued(order))
+        return cls._from_bits(order, sum(f.bit for f in order))
 
     def __init__(self, features):
-        self.features = self.features(features)
+        order = []
+        bits = hidden = 0
+        for f in features:
+            if not bits & f.bit:
+                order.append(f.__class__)
+                bits |= f.bit
+                if not f.visible:
+                    hidden |= f.bit
+        self.order = tuple(order)
+        self.bits = bits
+        self.hidden = hidden
 
     def copy(self):
-        return self.from_features(f.__class__() for f in self.features)
+        return self._from_bits(self.order, self.bits)
+
+    def __reduce_ex__(self, protocol):
+        if self.frozen:
+            return self._intern, (self.order,)
+        return super().__reduce_ex__(protocol)
 
     def __repr__(self):
         values = ' '.join(self.values)
         return f'{self.__class__.__name__}({values!r})'
 
     def __str__(self):
-        return ' '.join(map(str, self.features))
+        return ' '.join(f.value if visible else f'_{f.value}_'
+                        for f, visible in self._visibility())
 
     def __nonzero__(self):
-        return bool(self.features)
+        return bool(self.bits)
 
     def __len__(self):
-        return len(self.features)
+        return len(self.order)
+
+    @property
+    def features(self):
+        result = []
+        for f, visible in self._visibility():
+            f = f()
+            f.visible = visible
+            result.append(f)
+        return result
+
+    def _visibility(self):
+        hidden = self.hidden
+        return ((f, not hidden & f.bit) for f in self.order)
+
+    def indexes(self, *, visible=False):
+        """Return the sorted system indexes of the (visible) features."""
+        return sorted(f.index for f, v in self._visibility() if v or not visible)
 
     def issubset(self, other):
-        return self.features <= other.features
+        return not self.bits & ~other.bits
 
     def issubset_visible(self, other):
-        return self.features <= other.visible
+        return not self.bits & (other.hidden | ~other.bits)
 
     def hascommon(self, other):
-        return not self.features.isdisjoint(other.features)
+        return bool(self.bits & other.bits)
+
+    def subset_test(self, *, visible=False):
+        """Return a function testing if this set (as it is now) is a subset of its argument."""
+        bits = self.bits
+        if visible:
+            return lambda other: not bits & (other.hidden | ~other.bits)
+        return lambda other: not bits & ~other.bits
 
     def _clearlazy(self):
+        if self.frozen:
+            raise TypeError(f'{self!r} is frozen (interned), change a copy() of it.')
+        FeatureSet.generation = next(FeatureSet._generations)
         attrs = self.__dict__
-        for name in ('values', 'visible', 'values_visible'):
+        for name in ('values', 'values_visible'):
             if name in attrs:
                 del attrs[name]
 
     @functools.cached_property
     def values(self):
-        return [f.value for f in self.features]
-
-    @functools.cached_property
-    def visible(self):
-        return self.features.__class__(f for f in self.features if f.visible)
+        return [f.value for f in self.order]
 
     @functools.cached_property
     def values_visible(self):
-        return [f.value for f in self.features if f.visible]
+        return [f.value for f, visible in self._visibility() if visible]
 
     @property
     def by_category(self, *, groupkey=operator.attrgetter('category')):
-        features = sorted(self.features, key=groupkey)
+        features = sorted(self.order, key=groupkey)
         mapping = {k: [f.value for f in g]
                    for k, g in groupby(features, groupkey)}
         return [mapping.get(c, []) for c in self.__class__.system.categories]
 
     @property
     def by_specificity(self, *, groupkey=operator.attrgetter('specificity')):
-        features = sorted(self.features, key=groupkey)
+        features = sorted(self.order, key=groupkey)
         mapping = {k: [f.value for f in g]
                    for k, g in groupby(features, groupkey)}
         return [mapping.get(c, []) for c in self.__class__.system.specificities]
 
     def add(self, other):
         self._clearlazy()
-        self.features |= other.features
+        self._add(other)
+
+    def _add(self, other):
+        new = other.bits & ~self.bits
+        if new:
+            self.order += tuple(f for f in other.order if new & f.bit)
+            self.bits |= new
+            self.hidden |= other.hidden & new
 
     def remove(self, other, *, discard=False):
-        if not discard and not other.features <= self.features:
+        if not discard and not other.issubset(self):
             raise KeyError
         self._clearlazy()
-        self.features -= other.features
+        removed = self.bits & other.bits
+        if removed:
+            self.order = tuple(f for f in self.order if not removed & f.bit)
+            self.bits &= ~removed
+            self.hidden &= ~removed
 
     def consume(self, other):
-        if not other.features <= self.features:
+        if not other.issubset(self):
             raise KeyError
+        if other.bits & self.hidden:
+            raise ValueError(f'Unable to hide {other!r} in {self!r}.')
         self._clearlazy()
-        for f in other.features & self.features:
-            f.hide()
+        self.hidden |= other.bits
 
 
 class FeatureBag(FeatureSet):
-    """Ordered bag of morphosyntactic features."""
+    """Ordered bag of morphosyntactic features held as packed count vectors.
+
+    Each feature of the system owns a ``width``-bit lane at its index holding
+    its count, the top bit of each lane is kept clear as guard for the
+    lane-wise comparisons. The first ``hidden`` occurrences of a feature in
+    ``order`` are the consumed ones.
+    """
 
-    features: type[Container] = list
+    width = 8
+
+    @classmethod
+    def _from_order(cls, order):
+        order = tuple(order)
+        result = cls._from_bits(order, sum(f.lane for f in order))
+        result._check_overflow()
+        return result
+
+    def __init__(self, features):
+        order = []
+        bits = hidden = 0
+        for f in features:
+            order.append(f.__class__)
+            bits += f.lane
+            if not f.visible:
+                hidden += f.lane
+        self.order = tuple(order)
+        self.bits = bits
+        self.hidden = hidden
+        self._check_overflow()
+
+    def _check_overflow(self):
+        if self.bits & self.__class__.system.guards:
+            raise ValueError(f'{self!r} more than {(1 << self.width - 1) - 1}'
+                             ' occurrences of a feature.')
+
+    def _count(self, counts, feature):
+        return counts >> feature.index * self.width & ~(-1 << self.width)
+
+    def _support(self, counts):
+        system = self.__class__.system
+        return (counts + system.guards - system.lanes) & system.guards
+
+    def _visibility(self):
+        seen = collections.Counter()
+        for f in self.order:
+            seen[f] += 1
+            yield f, seen[f] > self._count(self.hidden, f)
 
     def issubset(self, other):
-        return all(map(other.features.__contains__, self.features))
+        guards = self.__class__.system.guards
+        return ((other.bits | guards) - self.bits) & guards == guards
 
     def issubset_visible(self, other):
-        return all(map(other.visible.__contains__, self.features))
+        guards = self.__class__.system.guards
+        return ((other.bits - other.hidden | guards) - self.bits) & guards == guards
 
     def hascommon(self, other):
-        return any(map(other.features.__contains__, self.features))
+        return bool(self._support(self.bits) & self._support(other.bits))
 
-    def add(self, other):
-        self._clearlazy()
-        self.features += other.features
+    def subset_test(self, *, visible=False):
+        bits, guards = self.bits, self.__class__.system.guards
+        if visible:
+            return lambda other: ((other.bits - other.hidden | guards) - bits) & guards == guards
+        return lambda other: ((other.bits | guards) - bits) & guards == guards
+
+    def _add(self, other):
+        self.order += other.order
+        self.bits += other.bits
+        self.hidden += other.hidden
+        self._check_overflow()
 
     def remove(self, other, *, discard=False):
-        if not discard and not self.issubset(other):
+        if not discard and not other.issubset(self):
             raise KeyError
         self._clearlazy()
-        if discard:
-            for f in other.features:
-                try:
-                    self.features.remove(f)
-                except ValueError:
-                    pass
-        else:
-            for f in other.features:
-                self.features.remove(f)
+        order = list(self.order)
+        for f in other.order:
+            try:
+                order.remove(f)
+            except ValueError:
+                continue
+            self.bits -= f.lane
+            if self._count(self.hidden, f):
+                self.hidden -= f.lane
+        self.order = tuple(order)
 
     def consume(self, other):
-        if not self.issubset(other):
+        if not other.issubset(self):
             raise KeyError
+        if not other.issubset_visible(self):
+            raise ValueError(f'Unable to hide {other!r} in {self!r}.')
         self._clearlazy()
-        for f in other.features:
-            for s in self.features:
-                if s == f and s.visible:
-                    s.hide()
-                    break
-            else:
-                raise ValueError
+        self.hidden += other.bits
 
 
 @meta.serializable
@@ -240,6 +388,11 @@ class FeatureSystem(object):
         return dumper.represent_sequence('tag:yaml.org,2002:seq', result)
 
     def __init__(self, features_kwargs=(), *, always_bag=False):
+        self.features_kwargs = features_kwargs = list(features_kwargs)
+        self.always_bag = bool(always_bag)
+        self.interned = {}
+        self.classes = {}
+
         class Feature(self.Feature):
             __slots__ = ()
             system = self
@@ -253,27 +406,40 @@ class FeatureSystem(object):
         if not len(self.mapping) == len(features_kwargs):
             raise ValueError(f'{self!r} no uniqueness.')
 
+        self.lanes = sum(f.lane for f in self.mapping.values())
+        self.guards = self.lanes << self.FeatureBag.width - 1
+
         self.specificities = sorted({f.specificity for f in self.mapping.values()},
                                     reverse=True)
 
         self.categories = tools.uniqued(f.category for f in self.mapping.values())
 
-        class FeatureSet(self.FeatureSet):
-            system = self
+        self.FeatureSet = self.bind(self.FeatureSet)
+        self.FeatureBag = self.bind(self.FeatureBag)
 
-        class FeatureBag(self.FeatureBag):
-            system = self
+    def bind(self, cls):
+        """Return the subclass of feature set class cls using this system (cached).
 
-        self.FeatureSet = FeatureSet
-        self.FeatureBag = FeatureBag
+        If the system has always_bag, the subclass also derives from FeatureBag.
+        """
+        try:
+            return self.classes[cls]
+        except KeyError:
+            pass
 
-        FeatureMeta.system = FeatureSetMeta.system = self
+        bag = self.__class__.FeatureBag
+        if self.always_bag and cls is self.__class__.FeatureSet:
+            result = self.bind(bag)
+        else:
+            bases = (cls, bag) if self.always_bag and not issubclass(cls, bag) else (cls,)
+            result = FeatureSetMeta(cls.__name__, bases,
+                                    {'system': self, '__module__': cls.__module__})
+        self.classes[cls] = result
+        return result
 
-        self.always_bag = bool(always_bag)
-        if always_bag:
-            # change the base of already referenced class
-            FeatureSet.__bases__ = (FeatureBag,)
-            FeatureSet.__name__ = 'FeatureBag'
+    def __reduce__(self):
+        return (functools.partial(self.__class__, always_bag=self.always_bag),
+                (self.features_kwargs,))
 
     def __len__(self):
         return len(self.mapping)
@@ -310,6 +476,8 @@ class FeatureSystem(object):
         Feature.__name__ = f'{name}Feature'
         Feature.name = name
         Feature.index = int(index)
+        Feature.bit = 1 << Feature.index
+        Feature.lane = 1 << Feature.index * self.FeatureBag.width
         Feature.key = self.get_key(value)
         Feature.value = value
         Feature.category = str(category).lower() if category else ''
@@ -1,10 +1,9 @@
 """Insert vocabulary items: Cyclic, Single, Flat, Once."""
 
 import logging
-import operator
 
+from . import contexts
 from . import meta
-from . import tools
 from . import vis
 
 __all__ = ['Insertion']
@@ -24,17 +23,32 @@ class Insertion(metaclass=meta.FactoryMeta('kind')):  # type: ignore[metaclass]
 
     Output = vis.ViList
 
-    def __init__(self, vis):
+    Matcher = vis.ViMatcher
+
+    matcher = 'index'
+
+    Position = contexts.HeadPosition
+
+    AllFeatures = contexts.SlotsFeatures
+
+    def __init__(self, vis, *, matcher=None):
         self.vis = vis
+        self.index = self.Matcher(matcher or self.matcher, vis)
+
+    def prepare(self, inputs):
+        """Let the matcher compute the candidates of all heads in inputs at once."""
+        self.index.prepare(head for slots in inputs for slot in slots for head in slot)
 
     def __call__(self, slots):
         matches = self.Matches()
         inserts = self.Inserts()
         output = self.Output()
 
-        for slot, left, right in tools.curr_pred_succ(slots):
+        all_features = self.AllFeatures(slots)
+
+        for i_s, slot in enumerate(slots):
             log.debug(slot)
-            slot_matches, slot_output = self.insert_slot(slot, left, right)
+            slot_matches, slot_output = self.insert_slot(slots, i_s, all_features)
             slot_output.sort()
 
             if self.single:
@@ -53,18 +67,18 @@ class Cyclic(Insertion):
 
     kind = 'cyclic'
 
-    def insert_slot(self, slot, left, right):
+    def insert_slot(self, slots, i_s, all_features):
         slot_matches = self.Matches()
         slot_output = self.Output()
 
-        for head, up in tools.curr_other(slot):
+        for position in self.Position.iterslot(slots, i_s, all_features):
+            head = position.head
             head_matches = self.Matches()
             head_output = self.Output()
-            is_matching = operator.methodcaller('match', head, left, right, up)
+
+            matching = self.index.matching(position)
 
             while True:
-                matching = self.vis.filter(is_matching)
-                matching.sort()
                 head_matches.append({'head': head.values_visible,
                                      'matches': matching})
 
@@ -77,6 +91,7 @@ class Cyclic(Insertion):
                 most_specific = matching[0]
                 head.consume(most_specific.features)
                 head_output.append(most_specific)
+                matching = matching.remaining(head, most_specific.features)
 
             slot_matches.append(head_matches)
             slot_output.extend(head_output)
@@ -96,12 +111,12 @@ class Flat(Insertion):
 
     kind = 'flat'
 
-    def insert_slot(self, slot, left, right):
+    def insert_slot(self, slots, i_s, all_features):
         matches = self.Matches()
         output = self.Output()
 
         while True:
-            matching = self.vis.matching_(slot, left, right)
+            matching = self.index.matching_(slots, i_s, all_features)
             matching.sort()
             matches.append(matching.as_dicts())
 
@@ -115,7 +130,7 @@ class Flat(Insertion):
             head, most_specific = matching[0]
             head.consume(most_specific.features)
 
-            log.debug(f' {slot}')
+            log.debug(f' {slots[i_s]}')
             output.append(most_specific)
 
         return matches, output
@@ -126,12 +141,13 @@ class Once(Insertion):
 
     kind = 'once'
 
-    def insert_slot(self, slot, left, right):
+    def insert_slot(self, slots, i_s, all_features):
         slot_matches = self.Matches()
         slot_output = self.Output()
 
-        for head, up in tools.curr_other(slot):
-            matching = self.vis.matching(head, left, right, up)
+        for position in self.Position.iterslot(slots, i_s, all_features):
+            head = position.head
+            matching = self.index.matching(position)
             matching_str = '\n'.join(f'    {m}' for m in matching)
             log.debug(f' {head} matches\n{matching_str}')
 
@@ -1,16 +1,44 @@
 """Meta-programming tools."""
 
 import collections
+import io
 
 import yaml
+from yaml import events
 
-__all__ = ['serializable', 'EmptySlotsMeta', 'FactoryMeta']
+try:
+    from yaml import CDumper as BaseDumper, CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import Dumper as BaseDumper, SafeLoader  # type: ignore[assignment]
+
+__all__ = ['Dumper', 'SafeLoader', 'load', 'dump', 'plain',
+           'MappingStream', 'PlainStream', 'resolve_aliases',
+           'serializable', 'value_type', 'EmptySlotsMeta', 'FactoryMeta']
+
+
+class Dumper(BaseDumper):
+    """YAML dumper (libyaml if available) never aliasing instances of registered value_types."""
+
+    value_types: tuple[type, ...] = ()
+
+    def ignore_aliases(self, data):
+        return isinstance(data, self.value_types) or super().ignore_aliases(data)
+
+
+DUMPERS = (yaml.Dumper, Dumper)
+
+
+def add_representer(data_type, func, *, multi=False):
+    """Register func as YAML representer for data_type (subclasses if multi) with DUMPERS."""
+    add = yaml.add_multi_representer if multi else yaml.add_representer
+    for dumper in DUMPERS:
+        add(data_type, func, Dumper=dumper)
 
 
 def serializes(data_type):
     """Register decorated function as YAML representer for type."""
     def decorator(func):
-        yaml.add_representer(data_type, func)
+        add_representer(data_type, func)
         return func
     return decorator
 
@@ -24,14 +52,210 @@ def odict_representer(dumper, self):
 def serializable(cls):
     """Register representer method of decorated class with YAML."""
     if hasattr(cls, '_representer'):
-        yaml.add_representer(cls, cls._representer)
+        add_representer(cls, cls._representer)
     elif hasattr(cls, '_multi_representer'):
-        yaml.add_multi_representer(cls, cls._multi_representer)
+        add_representer(cls, cls._multi_representer, multi=True)
     else:
         raise RuntimeError
     return cls
 
 
+def value_type(cls):
+    """Register decorated class to be serialized without YAML aliases (for shared instances)."""
+    Dumper.value_types += (cls,)
+    return cls
+
+
+def load(stream):
+    """Return the data of the YAML document in stream (with libyaml if available)."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def dump(data, stream):
+    """Write data as YAML document to stream (with libyaml if available)."""
+    yaml.dump(data, stream, Dumper=Dumper)
+
+
+def plain(data):
+    """Return data as plain dicts, lists, and scalars like load() of its dump() (no YAML text).
+
+    Values represented by the same node (aliases) are the same object.
+    """
+    constructor = yaml.constructor.SafeConstructor()
+    scalars = constructor.yaml_constructors
+    str_tag = 'tag:yaml.org,2002:str'
+    values = {}
+
+    def construct(node):
+        if isinstance(node, yaml.ScalarNode):
+            if node.tag == str_tag:
+                return node.value
+            return scalars[node.tag](constructor, node)
+        elif node in values:
+            return values[node]
+        elif isinstance(node, yaml.SequenceNode):
+            value = values[node] = [construct(n) for n in node.value]
+        else:
+            value = values[node] = {construct(k): construct(v) for k, v in node.value}
+        return value
+
+    return construct(Dumper(io.StringIO()).represent_data(data))
+
+
+class NodeStream(object):
+    """Represent a head mapping, the items of the sequence value of its last key one by one.
+
+    Items can refer to the anchored objects of head (always given an anchor),
+    other objects are represented anew for each item and only kept while it is written.
+    """
+
+    def __init__(self, stream, head, key, *, anchored=(), Dumper=Dumper):  # noqa: N803
+        self.dumper = dumper = Dumper(stream)
+        dumper.anchors, dumper.serialized_nodes, dumper.last_anchor_id = {}, {}, 0
+
+        head = collections.OrderedDict(head)
+        head[key] = []
+        self.node = node = dumper.represent_data(head)
+        *self.pairs, (self.key, self.sequence) = node.value
+
+        dumper.anchor_node(node)
+        self.anchored = list(anchored)  # keep alive so their ids are not reused
+        self.objects, self.anchors = {}, {}
+        for obj in self.anchored:
+            self.objects[id(obj)] = obj_node = dumper.represented_objects[id(obj)]
+            if dumper.anchors[obj_node] is None:
+                dumper.anchors[obj_node] = dumper.generate_anchor(obj_node)
+            self.anchors[obj_node] = dumper.anchors[obj_node]
+
+        self.written = 0
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+
+    def represent(self, item):
+        """Return the node of item with its anchors (discarding those of the previous item)."""
+        dumper = self.dumper
+        dumper.represented_objects = dict(self.objects)
+        dumper.anchors = dict(self.anchors)
+        dumper.serialized_nodes = dict.fromkeys(self.anchors, True)
+        dumper.object_keeper = []
+
+        node = dumper.represent_data(item)
+        dumper.anchor_node(node)
+        return node
+
+    def open(self):
+        pass
+
+    def write(self, item):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class MappingStream(NodeStream):
+    """Write a YAML mapping document, the sequence value of its last key item by item."""
+
+    def open(self):
+        """Write the head items and the start of the sequence."""
+        dumper, node = self.dumper, self.node
+        dumper.open()
+        dumper.emit(events.DocumentStartEvent(explicit=False))
+        implicit = node.tag == dumper.resolve(yaml.MappingNode, node.value, True)
+        dumper.emit(events.MappingStartEvent(None, node.tag, implicit,
+                                             flow_style=node.flow_style))
+        for key, value in self.pairs:
+            dumper.serialize_node(key, node, None)
+            dumper.serialize_node(value, node, key)
+        dumper.serialize_node(self.key, node, None)
+
+        sequence = self.sequence
+        implicit = sequence.tag == dumper.resolve(yaml.SequenceNode, sequence.value, True)
+        dumper.emit(events.SequenceStartEvent(None, sequence.tag, implicit,
+                                              flow_style=False))
+
+    def write(self, item):
+        """Write item to the sequence (discarding its nodes afterwards)."""
+        node = self.represent(item)
+        self.dumper.serialize_node(node, self.sequence, self.written)
+        self.written += 1
+
+    def close(self):
+        """Write the end of the sequence and of the document."""
+        dumper = self.dumper
+        dumper.emit(events.SequenceEndEvent())
+        dumper.emit(events.MappingEndEvent())
+        dumper.emit(events.DocumentEndEvent(explicit=False))
+        dumper.close()
+        dumper.dispose()
+
+
+class PlainStream(NodeStream):
+    """Pass the head mapping (without key) and the items as plain records to write_record.
+
+    Records are dicts, lists, and scalars (as from load()), anchored values
+    are wrapped as {'&': anchor, '=': value}, aliases are {'*': anchor}
+    (see resolve_aliases()).
+    """
+
+    def __init__(self, write_record, head, key, *, anchored=(), Dumper=Dumper):  # noqa: N803
+        super().__init__(io.StringIO(), head, key, anchored=anchored, Dumper=Dumper)
+        self.write_record = write_record
+        self.constructor = yaml.constructor.SafeConstructor()
+
+    def open(self):
+        """Write the head record."""
+        self.write_record({self.plain(key): self.plain(value) for key, value in self.pairs})
+
+    def write(self, item):
+        """Write the record of item (discarding its nodes afterwards)."""
+        self.write_record(self.plain(self.represent(item)))
+        self.written += 1
+
+    def plain(self, node):
+        anchor = self.dumper.anchors[node]
+        if anchor is not None:
+            if node in self.dumper.serialized_nodes:
+                return {'*': anchor}
+            self.dumper.serialized_nodes[node] = True
+
+        if isinstance(node, yaml.ScalarNode):
+            value = self.constructor.yaml_constructors[node.tag](self.constructor, node)
+        elif isinstance(node, yaml.SequenceNode):
+            value = [self.plain(n) for n in node.value]
+        else:
+            value = {self.plain(k): self.plain(v) for k, v in node.value}
+
+        return value if anchor is None else {'&': anchor, '=': value}
+
+
+def resolve_aliases(value, anchors):
+    """Return plain record value with anchored values and their aliases resolved (in place).
+
+    anchors maps the anchors already resolved (from previous records) to their values.
+    """
+    if isinstance(value, dict):
+        if len(value) == 1 and '*' in value:
+            return anchors[value['*']]
+        elif len(value) == 2 and '&' in value and '=' in value:
+            anchors[value['&']] = result = resolve_aliases(value['='], anchors)
+            return result
+        for k, v in value.items():
+            if isinstance(v, (dict, list)):
+                value[k] = resolve_aliases(v, anchors)
+    elif isinstance(value, list):
+        for i, v in enumerate(value):
+            if isinstance(v, (dict, list)):
+                value[i] = resolve_aliases(v, anchors)
+    return value
+
+
 class EmptySlotsMeta(type):
     """Set empty __slots__ on all derived classes."""
 
@@ -8,20 +8,55 @@ FeaturesContext
 """
 
 import collections
-from itertools import chain
+from itertools import chain, islice
 
 from . import exponents
 from . import features
 from . import meta
 from . import types
 
-__all__ = ['ViContext', 'ViContexts']
+__all__ = ['ViPosition', 'ViContext', 'ViContexts']
+
+
+class ViPosition(object):
+    """Vocabulary item in a sequence with lazy access to the vis around it (no copying)."""
+
+    __slots__ = ('vis', 'index', 'vi')
+
+    @classmethod
+    def itervis(cls, vis):
+        for index, vi in enumerate(vis):
+            yield cls(vis, index, vi)
+
+    def __init__(self, vis, index, vi):
+        self.vis = vis
+        self.index = index
+        self.vi = vi
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.vis!r}, index={self.index!r})'
+
+    @property
+    def left(self):
+        """Left-adjacent vi (None at the start)."""
+        return self.vis[self.index - 1] if self.index else None
+
+    @property
+    def right(self):
+        """Right-adjacent vi (None at the end)."""
+        index = self.index + 1
+        return self.vis[index] if index < len(self.vis) else None
+
+    def others(self):
+        """All vis but this one."""
+        vis = self.vis
+        return chain(islice(vis, self.index), islice(vis, self.index + 1, None))
 
 
 class ViContext(metaclass=meta.FactoryMeta('scope', collections.OrderedDict)):  # type: ignore[metaclass]  # noqa: E501
     """Context matching vis under defined conditions."""
 
-    def match(self, vi, left_context, right_context):
+    def match(self, position):
         raise NotImplementedError
 
 
@@ -30,9 +65,9 @@ class ViContexts(types.Instances):
 
     new_item = ViContext
 
-    def __init__(self, **kwcontexts):
+    def __init__(self, *, system, **kwcontexts):
         scopes = iter(self.new_item.subclasses)
-        items = (self.new_item(s, kwcontexts[s])
+        items = (self.new_item(s, kwcontexts[s], system=system)
                  for s in scopes if s in kwcontexts)
         super(types.Instances, self).__init__(items)
 
@@ -55,7 +90,7 @@ class ExponentContext(ViContext):
 
     Exponent = exponents.Exponent
 
-    def __init__(self, exponent):
+    def __init__(self, exponent, *, system=None):
         self.target = self.exponent = self.Exponent(exponent)
         if not self.exponent:
             raise ValueError(f'{self!r} no exponent.')
@@ -77,8 +112,8 @@ class ThisExponent(ExponentContext):
     def __str__(self):
         return f'{self.exponent}'
 
-    def match(self, vi, left_context, right_context):
-        return self.exponent == vi.exponent
+    def match(self, position):
+        return self.exponent == position.vi.exponent
 
 
 class LeftExponent(ExponentContext):
@@ -89,8 +124,9 @@ class LeftExponent(ExponentContext):
     def __str__(self):
         return f'{self.exponent}__'
 
-    def match(self, vi, left_context, right_context):
-        return left_context and self.exponent == left_context[-1].exponent
+    def match(self, position):
+        left = position.left
+        return left is not None and self.exponent == left.exponent
 
 
 class RightExponent(ExponentContext):
@@ -101,8 +137,9 @@ class RightExponent(ExponentContext):
     def __str__(self):
         return f'__{self.exponent}'
 
-    def match(self, vi, left_context, right_context):
-        return right_context and self.exponent == right_context[0].exponent
+    def match(self, position):
+        right = position.right
+        return right is not None and self.exponent == right.exponent
 
 
 class OtherExponent(ExponentContext):
@@ -113,9 +150,8 @@ class OtherExponent(ExponentContext):
     def __str__(self):
         return f'__...{self.exponent}'
 
-    def match(self, vi, left_context, right_context):
-        other = chain(left_context.exponents, right_context.exponents)
-        return self.exponent in other
+    def match(self, position):
+        return self.exponent in (o.exponent for o in position.others())
 
 
 class FeaturesContext(ViContext):
@@ -123,8 +159,8 @@ class FeaturesContext(ViContext):
 
     Features = features.FeatureSet
 
-    def __init__(self, features):
-        self.target = self.features = self.Features(features)
+    def __init__(self, features, *, system):
+        self.target = self.features = system.bind(self.Features)(features)
         if not self.features:
             raise ValueError(f'{self!r} no features.')
 
@@ -146,8 +182,8 @@ class ThisFeatures(FeaturesContext):
     def __str__(self):
         return f'[{self.features}]'
 
-    def match(self, vi, left_context, right_context):
-        return self.features.issubset(vi.features)
+    def match(self, position):
+        return self.features.issubset(position.vi.features)
 
 
 class LeftFeatures(FeaturesContext):
@@ -158,9 +194,9 @@ class LeftFeatures(FeaturesContext):
     def __str__(self):
         return f'[{self.features}]__'
 
-    def match(self, vi, left_context, right_context):
-        return (left_context
-                and self.features.issubset(left_context[-1].features))
+    def match(self, position):
+        left = position.left
+        return left is not None and self.features.issubset(left.features)
 
 
 class RightFeatures(FeaturesContext):
@@ -171,9 +207,9 @@ class RightFeatures(FeaturesContext):
     def __str__(self):
         return f'__[{self.features}]'
 
-    def match(self, vi, left_context, right_context):
-        return (right_context
-                and self.features.issubset(right_context[0].features))
+    def match(self, position):
+        right = position.right
+        return right is not None and self.features.issubset(right.features)
 
 
 class OtherFeatures(FeaturesContext):
@@ -184,6 +220,5 @@ class OtherFeatures(FeaturesContext):
     def __str__(self):
         return f'__...[{self.features}]'
 
-    def match(self, vi, left_context, right_context):
-        other = chain(left_context, right_context)
-        return any(self.features.issubset(o.features) for o in other)
+    def match(self, position):
+        return any(self.features.issubset(o.features) for o in position.others())
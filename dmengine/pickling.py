@@ -0,0 +1,68 @@
+"""Pickle calculation objects across processes sharing the same analysis.
+
+Feature and feature set classes are created per feature system, they are
+pickled by key (and base class) and resolved in the given system on loading,
+as is the feature system itself. Vocabulary items of the inventory are
+pickled by position and resolved in the given inventory.
+"""
+
+import io
+import pickle
+
+from . import features
+
+__all__ = ['dumps', 'loads']
+
+
+class Pickler(pickle.Pickler):
+    """Pickle feature (set) classes by key (base) and inventory vis by position."""
+
+    def __init__(self, file, *, vis=(), protocol=pickle.HIGHEST_PROTOCOL):
+        super().__init__(file, protocol=protocol)
+        self.vis_positions = {id(vi): i for i, vi in enumerate(vis)}
+
+    def persistent_id(self, obj):
+        if isinstance(obj, type):
+            if issubclass(obj, features.Feature) and hasattr(obj, 'key'):
+                return 'feature', obj.key
+            if issubclass(obj, features.FeatureSet) and 'system' in obj.__dict__:
+                return 'featureset', obj.__bases__[0]
+        elif isinstance(obj, features.FeatureSystem):
+            return 'system', None
+        if id(obj) in self.vis_positions:
+            return 'vi', self.vis_positions[id(obj)]
+        return None
+
+
+class Unpickler(pickle.Unpickler):
+    """Resolve feature (set) classes in features system and vis in the vis inventory."""
+
+    def __init__(self, file, *, features, vis=()):
+        super().__init__(file)
+        self.features = features
+        self.vis = vis
+
+    def persistent_load(self, pid):
+        kind, key = pid
+        if kind == 'feature':
+            return self.features.mapping[key]
+        elif kind == 'featureset':
+            return self.features.bind(key)
+        elif kind == 'system':
+            return self.features
+        elif kind == 'vi':
+            return self.vis[key]
+        raise pickle.UnpicklingError(f'unsupported persistent id: {pid!r}')
+
+
+def dumps(obj, *, vis=()):
+    """Return pickled obj, refering to feature classes and inventory vis."""
+    with io.BytesIO() as f:
+        Pickler(f, vis=vis).dump(obj)
+        return f.getvalue()
+
+
+def loads(data, *, features, vis=()):
+    """Return unpickled data resolving feature classes and vis."""
+    with io.BytesIO(data) as f:
+        return Unpickler(f, features=features, vis=vis).load()
@@ -11,7 +11,6 @@ import re
 from . import exponents
 from . import meta
 from . import outcontexts
-from . import tools
 from . import types
 
 __all__ = ['Readjustment', 'Readjustments']
@@ -34,9 +33,9 @@ class Readjustment(metaclass=meta.FactoryMeta('kind')):  # type: ignore[metaclas
             result.update(self.contexts.items())
         return dumper.represent_mapping('tag:yaml.org,2002:map', result.items())
 
-    def __init__(self, exponent, **kwcontexts):
+    def __init__(self, exponent, *, system, **kwcontexts):
         self.exponent = self.Exponent(exponent)
-        self.contexts = self.Contexts(**kwcontexts)
+        self.contexts = self.Contexts(system=system, **kwcontexts)
 
     def __repr__(self):
         exponent = self.exponent.value
@@ -44,16 +43,16 @@ class Readjustment(metaclass=meta.FactoryMeta('kind')):  # type: ignore[metaclas
         return f'{self.__class__.__name__}(exponent={exponent!r}{contexts})'
 
     def all_contexts_and_exp_match(self, vis):
-        for i, (vi, left, right) in enumerate(tools.curr_pred_succ(vis)):
-            matching = operator.methodcaller('match', vi, left, right)
-            if self.exponent == vi.exponent and all(map(matching, self.contexts)):
-                yield i, vi
+        for position in outcontexts.ViPosition.itervis(vis):
+            matching = operator.methodcaller('match', position)
+            if self.exponent == position.vi.exponent and all(map(matching, self.contexts)):
+                yield position.index, position.vi
 
     def all_contexts_match(self, vis):
-        for i, (vi, left, right) in enumerate(tools.curr_pred_succ(vis)):
-            matching = operator.methodcaller('match', vi, left, right)
+        for position in outcontexts.ViPosition.itervis(vis):
+            matching = operator.methodcaller('match', position)
             if all(map(matching, self.contexts)):
-                yield i, vi
+                yield position.index, position.vi
 
     def __call__(self, vis):
         raise NotImplementedError
@@ -100,7 +99,7 @@ class MetatheseExponents(Readjustment):
 
     kind = 'metathesis'
 
-    def __init__(self, first_exponent, second_exponent):
+    def __init__(self, first_exponent, second_exponent, *, system=None):
         self.first_exponent = self.Exponent(first_exponent)
         self.second_exponent = self.Exponent(second_exponent)
 
@@ -128,10 +127,10 @@ class TransformExponent(Readjustment):
 
     kind = 'transform'
 
-    def __init__(self, search, replace, **kwcontexts):
+    def __init__(self, search, replace, *, system, **kwcontexts):
         self.search = search
         self.replace = replace
-        self.contexts = self.Contexts(**kwcontexts)
+        self.contexts = self.Contexts(system=system, **kwcontexts)
         self._subn = re.compile(search).subn
 
     def __repr__(self):
@@ -1,4 +1,4 @@
-"""Create LaTeX reports from analysis results YAML file and render to PDF."""
+"""Create LaTeX reports from analysis results file and render to PDF."""
 
 from .report import Report
 
@@ -1,7 +1,10 @@
 """Compile LaTeX file to PDF, optionally open in viewer."""
 
+import hashlib
+import logging
 import os
 import platform
+import re
 import subprocess
 
 from . import tools
@@ -10,6 +13,13 @@ __all__ = ['compile']
 
 PLATFORM = platform.system().lower()
 
+AUX_EXTENSIONS = ('aux', 'toc', 'out')
+
+INPUT = re.compile(rb'\\input\{([^}]+)\}')
+
+
+log = logging.getLogger()
+
 
 def apply(f, *args, **kwargs):
     return f(*args, **kwargs)
@@ -19,18 +29,69 @@ def no_compile(filename, *, view=False):
     raise NotImplementedError('platform not supported')
 
 
-def pdflatex_compile(filename, *, view=False):
-    """Compile LaTeX file by running pdflatex three times."""
-    pdflatex = ['pdflatex', '-output-format=pdf', '-interaction=batchmode', '-halt-on-error']
-    compile_dir = os.path.dirname(filename)
-    if compile_dir:
-        pdflatex.append(f'-output-directory={compile_dir}')
-    pdflatex.append(filename)
+def pdflatex_compile(filename, *, view=False, max_runs=3):
+    """Compile LaTeX file by running pdflatex until its .aux file is stable (max_runs).
+
+    Skip compiling if the file and its \\input files did not change since the last
+    compilation (their hash is stored in a .hash file next to it).
+    """
+    compile_dir, name = os.path.split(filename)  # \input files are relative to the file
+    hashfile = tools.swapext(filename, 'hash')
+    pdfname = tools.swapext(filename, 'pdf')
+
+    source = source_hash(filename)
+    if os.path.exists(pdfname) and read_file(hashfile) == source:
+        log.info(f'\t{pdfname!r} unchanged, skip compile..')
+    else:
+        pdflatex = ['pdflatex', '-output-format=pdf', '-interaction=batchmode',
+                    '-halt-on-error', name]
+        auxfiles = [tools.swapext(name, ext) for ext in AUX_EXTENSIONS]
+
+        with tools.chdir(compile_dir):
+            aux = files_hash(auxfiles)
+            for _ in range(max_runs):
+                subprocess.check_call(pdflatex)
+                aux, previous = files_hash(auxfiles), aux
+                if aux == previous:
+                    break
+
+        with open(hashfile, 'w', encoding='ascii') as f:
+            f.write(source)
 
-    for _ in range(3):
-        subprocess.check_call(pdflatex)
     if view:
-        open_viewer(tools.swapext(filename, 'pdf'))
+        open_viewer(pdfname)
+
+
+def source_hash(filename):
+    """Return the hash of the LaTeX file and of the files it includes with \\input."""
+    with open(filename, 'rb') as f:
+        source = f.read()
+
+    result = hashlib.sha256(source)
+    compile_dir = os.path.dirname(filename)
+    for name in INPUT.findall(source):
+        name = os.path.join(compile_dir, os.fsdecode(name))
+        if not os.path.splitext(name)[1]:
+            name += '.tex'
+        result.update(read_file(name, mode='rb') or b'')
+    return result.hexdigest()
+
+
+def files_hash(filenames):
+    """Return the hash of the contents of the existing files."""
+    result = hashlib.sha256()
+    for name in filenames:
+        result.update(read_file(name, mode='rb') or b'')
+    return result.hexdigest()
+
+
+def read_file(filename, *, mode='r'):
+    """Return the contents of filename (None if it does not exist)."""
+    try:
+        with open(filename, mode) as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
 
 
 def latexmk_compile(filename, *, view=False):
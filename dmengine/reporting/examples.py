@@ -1,10 +1,7 @@
-from itertools import count
-
-
-def render_example(content, *, caption=None, labelize=False):
-    if labelize:
+def render_example(content, *, caption=None, numbers=None):
+    if numbers is not None:
         assert not isinstance(content, list)
-        label, ref = get_label()
+        label, ref = get_label(numbers)
         lines = '\n'.join(get_lines(content, caption, label))
         return lines, ref
     else:
@@ -12,8 +9,8 @@ def render_example(content, *, caption=None, labelize=False):
         return lines
 
 
-def get_label(*, index_counter=count(1)):
-    index = next(index_counter)
+def get_label(numbers):
+    index = next(numbers)
     label = '\\label{ex:%d} ' % index
     reference = '\\ref{ex:%d} ' % index
     return label, reference
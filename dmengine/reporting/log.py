@@ -1,4 +1,6 @@
+import functools
 from itertools import pairwise, product, repeat
+import os
 
 from .features import render_features
 from .inputs import render_slotlist, render_slot, render_head
@@ -6,68 +8,90 @@ from .paradigms import is_transitive, para_logs
 from .vis import render_exponent, render_vi
 
 
-def render_log(paradigms, worklog, rules, readjustments):
-    return '\n'.join(lines(paradigms, worklog, rules, readjustments))
+def render_log(paradigms, worklog, rules, readjustments, *, mapper=map, filenames=None):
+    yield '\\footnotesize'
+    if mapper is map and filenames is None:  # stream the lines
+        for paradigm, logs in para_logs(paradigms, worklog):
+            for line in lines(paradigm, logs, rules, readjustments):
+                yield '\n'
+                yield line
+        return
 
+    logs = (logs for _, logs in para_logs(paradigms, worklog))
+    if filenames is None:
+        filenames = repeat(None)
+    render = functools.partial(paradigm_log, rules=rules, readjustments=readjustments)
+    for chunk in mapper(render, paradigms, logs, filenames):
+        yield '\n'
+        yield chunk
 
-def lines(paradigms, worklog, rules, readjustments):
-    yield '\\footnotesize'
-    for paradigm, logs in para_logs(paradigms, worklog):
-        yield '\\subsection{%s}' % paradigm['name']
-        if is_transitive(paradigm):
-            sub_obj = product(*paradigm['headers'])
+
+def paradigm_log(paradigm, logs, filename=None, *, rules, readjustments, encoding='utf-8'):
+    if filename is None:
+        return '\n'.join(lines(paradigm, logs, rules, readjustments))
+
+    with open(filename, 'w', encoding=encoding, newline='') as fd:
+        fd.writelines(f'{line}\n' for line in lines(paradigm, logs, rules, readjustments))
+    name, _ = os.path.splitext(os.path.basename(filename))
+    return '\\input{%s}' % name
+
+
+def lines(paradigm, logs, rules, readjustments):
+    yield '\\subsection{%s}' % paradigm['name']
+    if is_transitive(paradigm):
+        sub_obj = product(*paradigm['headers'])
+    else:
+        sub_obj = zip(paradigm['headers'][0], repeat(''))
+    for log, (sub, obj) in zip(logs, sub_obj):
+        if obj:
+            yield '\\minisec{%s:%s}' % (sub, obj)
         else:
-            sub_obj = zip(paradigm['headers'][0], repeat(''))
-        for log, (sub, obj) in zip(logs, sub_obj):
-            if obj:
-                yield '\\minisec{%s:%s}' % (sub, obj)
-            else:
-                yield '\\minisec{%s}' % sub
-            yield 'Input (Rule applied)'
-            yield '\\begin{itemize}'
-            yield '\\item %s' % render_slotlist(log['input_pre'])
-            for i, (pre, pst) in enumerate(pairwise([log['input_pre']] + log['input_pro'])):
-                if pst is not pre:
-                    rule = rules[i]
-                    yield '\\item %s %s' % (render_slotlist(pst), rule['ref'])
-            yield '\\end{itemize}\n'
-            if not log['inserts']:
-                continue
-            yield 'Matches'
+            yield '\\minisec{%s}' % sub
+        yield 'Input (Rule applied)'
+        yield '\\begin{itemize}'
+        yield '\\item %s' % render_slotlist(log['input_pre'])
+        for i, (pre, pst) in enumerate(pairwise([log['input_pre']] + log['input_pro'])):
+            if pst is not pre:
+                rule = rules[i]
+                yield '\\item %s %s' % (render_slotlist(pst), rule['ref'])
+        yield '\\end{itemize}\n'
+        if not log['inserts']:
+            continue
+        yield 'Matches'
+        yield '\\begin{itemize}'
+        for slt, slt_match in zip(log['input_pst'], log['matches']):
+            yield '\\item %s' % render_slot(slt)
             yield '\\begin{itemize}'
-            for slt, slt_match in zip(log['input_pst'], log['matches']):
-                yield '\\item %s' % render_slot(slt)
+            for hd, hd_match in zip(slt, slt_match):
+                yield '\\item %s' % render_head(hd)
                 yield '\\begin{itemize}'
-                for hd, hd_match in zip(slt, slt_match):
-                    yield '\\item %s' % render_head(hd)
+                for match in hd_match:
+                    yield '\\item %s' % render_features(match['head'])
+                    if not match['matches']:
+                        continue
                     yield '\\begin{itemize}'
-                    for match in hd_match:
-                        yield '\\item %s' % render_features(match['head'])
-                        if not match['matches']:
-                            continue
-                        yield '\\begin{itemize}'
-                        for m in match['matches']:
-                            yield '\\item %s %s' % (render_vi(m), m['ref'])
-                        yield '\\end{itemize}'
+                    for m in match['matches']:
+                        yield '\\item %s %s' % (render_vi(m), m['ref'])
                     yield '\\end{itemize}'
                 yield '\\end{itemize}'
-            yield '\\end{itemize}\n'
-            yield 'Inserts'
-            yield '\\begin{itemize}'
-            yield '\\item %s' % insertlist(log['inserts'])
-            yield '\\end{itemize}\n'
-            yield 'Output (Readjustment applied)'
-            yield '\\begin{itemize}'
-            yield '\\item %s' % vilist(log['output_pre'])
-            for i, (pre, pst) in enumerate(pairwise([log['output_pre']] + log['output_pro'])):
-                if pst is not pre:
-                    readjustment = readjustments[i]
-                    yield '\\item %s %s' % (vilist(pst), readjustment['ref'])
-            yield '\\end{itemize}\n'
-            yield 'Spellout'
-            yield '\\begin{itemize}'
-            yield '\\item %s' % render_exponent(log['spellout'])
-            yield '\\end{itemize}\n'
+            yield '\\end{itemize}'
+        yield '\\end{itemize}\n'
+        yield 'Inserts'
+        yield '\\begin{itemize}'
+        yield '\\item %s' % insertlist(log['inserts'])
+        yield '\\end{itemize}\n'
+        yield 'Output (Readjustment applied)'
+        yield '\\begin{itemize}'
+        yield '\\item %s' % vilist(log['output_pre'])
+        for i, (pre, pst) in enumerate(pairwise([log['output_pre']] + log['output_pro'])):
+            if pst is not pre:
+                readjustment = readjustments[i]
+                yield '\\item %s %s' % (vilist(pst), readjustment['ref'])
+        yield '\\end{itemize}\n'
+        yield 'Spellout'
+        yield '\\begin{itemize}'
+        yield '\\item %s' % render_exponent(log['spellout'])
+        yield '\\end{itemize}\n'
 
 
 def explist(exponents):
@@ -46,40 +46,43 @@ def para_logs(paradigms, worklog):
         log_cursor = log_slice.stop
 
 
-def paradigms(paradigms, worklog):
-    tabs = []
-    for paradigm, logs in para_logs(paradigms, worklog):
-        spellouts = [l['spellout'] for l in logs]  # noqa: E741
-        para_func = trans_paradigm if is_transitive(paradigm) else intrans_paradigm
-        tabs.append('\\subsection{%s}\n' % paradigm['name'])
-        tabs.append(para_func(paradigm['headers'],
-                              list(map(render_exponent, spellouts))))
-    return ''.join(tabs)
+def paradigms(paradigms, worklog, *, mapper=map):
+    spellouts = ([l['spellout'] for l in logs]  # noqa: E741
+                 for _, logs in para_logs(paradigms, worklog))
+    yield from mapper(paradigm_outputs, paradigms, spellouts)
+
+
+def paradigm_outputs(paradigm, spellouts):
+    para_func = trans_paradigm if is_transitive(paradigm) else intrans_paradigm
+    return ('\\subsection{%s}\n' % paradigm['name']
+            + para_func(paradigm['headers'], list(map(render_exponent, spellouts))))
 
 
 def trans_inp(inp):
     return ''.join(render_features(f, brackets=True) for f in inp)
 
 
-def input_paradigms(paradigms):
-    tabs = ['\\small\n']
-    for paradigm in paradigms:
-        tab = ['\\subsection{%s}\n' % paradigm['name']]
-        para_func = folded_paradigm if is_transitive(paradigm) else intrans_paradigm
-        tab.append(para_func(paradigm['headers'],
-                             list(map(trans_inp, paradigm['inputs'])),
-                             center=True))
-        tabs.append(''.join(tab))
-    return ''.join(tabs)
-
-
-def input_paradigms_processed(paradigms, worklog):
-    tabs = ['\\small\n']
-    for paradigm, logs in para_logs(paradigms, worklog):
-        tab = ['\\subsection{%s}\n' % paradigm['name']]
-        para_func = folded_paradigm if is_transitive(paradigm) else intrans_paradigm
-        tab.append(para_func(paradigm['headers'],
-                             [render_slotlist(log['input_pst']) for log in logs],
-                             center=True))
-        tabs.append(''.join(tab))
-    return ''.join(tabs)
+def input_paradigms(paradigms, *, mapper=map):
+    yield '\\small\n'
+    yield from mapper(paradigm_inputs, paradigms)
+
+
+def input_paradigms_processed(paradigms, worklog, *, mapper=map):
+    yield '\\small\n'
+    inputs = ([log['input_pst'] for log in logs]
+              for _, logs in para_logs(paradigms, worklog))
+    yield from mapper(paradigm_inputs_processed, paradigms, inputs)
+
+
+def paradigm_inputs(paradigm):
+    para_func = folded_paradigm if is_transitive(paradigm) else intrans_paradigm
+    return ('\\subsection{%s}\n' % paradigm['name']
+            + para_func(paradigm['headers'], list(map(trans_inp, paradigm['inputs'])),
+                        center=True))
+
+
+def paradigm_inputs_processed(paradigm, inputs):
+    para_func = folded_paradigm if is_transitive(paradigm) else intrans_paradigm
+    return ('\\subsection{%s}\n' % paradigm['name']
+            + para_func(paradigm['headers'], list(map(render_slotlist, inputs)),
+                        center=True))
@@ -9,10 +9,10 @@ from .examples import render_example
 MAP: dict[str, Callable[..., Any]] = {}
 
 
-def render_readjustments(readjustments):
+def render_readjustments(readjustments, *, numbers):
     if not readjustments:
         return ''
-    examples_refs = (render_example(MAP[r['kind']](r), labelize=True)
+    examples_refs = (render_example(MAP[r['kind']](r), numbers=numbers)
                      for r in readjustments)
     examples, refs = zip(*examples_refs)
     for r, ref in zip(readjustments, refs):
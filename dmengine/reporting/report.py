@@ -1,8 +1,10 @@
+import functools
+import itertools
 import logging
+import os
 import string
 
-import yaml
-
+from .. import results
 from . import backend
 from . import tools
 
@@ -20,59 +22,116 @@ log = logging.getLogger()
 
 
 class Report(object):
-    """LaTeX source from DM analyis results YAML file."""
+    """LaTeX source from DM analyis results file (YAML, JSON lines, MessagePack).
+
+    analysis can also be a calculated Analysis, rendered from memory
+    (without reading its results file). The paradigm and log sections are
+    rendered lazily, in chunks straight into the file on save(), one chunk
+    per paradigm (with workers > 1 in a pool of worker processes). With
+    split_log, the log of each paradigm is saved into its own file (-log<n>.tex)
+    included with \\input.
+    """
 
     template = tools.current_path('template.tex')
 
-    def __init__(self, analysis, *, filename=None, pdfname=None, encoding='utf-8'):
+    def __init__(self, analysis, *, filename=None, pdfname=None, workers=None,
+                 split_log=False, encoding='utf-8'):
         self.analysis = analysis
+        self.workers = workers
+        if isinstance(analysis, (str, os.PathLike)):
+            results_file = os.fspath(analysis)
+        else:
+            results_file = analysis.results
         if filename is None:
-            filename = tools.swapext(analysis, 'tex')
+            filename = tools.swapext(results_file, 'tex')
         self.filename = filename
         if pdfname is None:
-            pdfname = tools.swapext(analysis, 'pdf')
+            pdfname = tools.swapext(results_file, 'pdf')
         self.pdfname = pdfname
 
         log.info(f'{self!r}')
 
-        with open(self.analysis, encoding=encoding) as fd:
-            analysis = yaml.safe_load(fd)
+        if isinstance(analysis, (str, os.PathLike)):
+            analysis = results.load(results_file, encoding=encoding)
+        else:
+            analysis = analysis.plain()
 
         log.info('\tcreate..')
+        numbers = itertools.count(1)  # of the labelled examples
         self.sections = {
             'AUTHOR': analysis['author'],
             'TITLE': analysis['title'],
             'FEATURES': render_featureconfig(analysis['features']),
-            'VOCABULARY_ITEMS': render_vis(analysis['vis']),
-            'RULES': render_rules(analysis['rules']),
-            'READJUSTMENTS': render_readjustments(analysis['readjustments']),
-            'OUTPUTS': paradigms(analysis['paradigms'], analysis['worklog']),
-            'INPUTS': input_paradigms(analysis['paradigms']),
-            'INPUTS_PROCESSED': input_paradigms_processed(analysis['paradigms'],
-                                                          analysis['worklog']),
+            'VOCABULARY_ITEMS': render_vis(analysis['vis'], numbers=numbers),
+            'RULES': render_rules(analysis['rules'], numbers=numbers),
+            'READJUSTMENTS': render_readjustments(analysis['readjustments'],
+                                                  numbers=numbers),
+            'OUTPUTS': functools.partial(paradigms, analysis['paradigms'],
+                                         analysis['worklog']),
+            'INPUTS': functools.partial(input_paradigms, analysis['paradigms']),
+            'INPUTS_PROCESSED': functools.partial(input_paradigms_processed,
+                                                  analysis['paradigms'],
+                                                  analysis['worklog']),
         }
 
         if analysis['insertion'] != 'flat':
-            self.sections['LOG'] = render_log(analysis['paradigms'],
-                                              analysis['worklog'],
-                                              analysis['rules'],
-                                              analysis['readjustments'])
+            log_files = None
+            if split_log:
+                stem, _ = os.path.splitext(self.filename)
+                log_files = [f'{stem}-log{i}.tex'
+                             for i, _ in enumerate(analysis['paradigms'], start=1)]
+            self.sections['LOG'] = functools.partial(render_log,
+                                                     analysis['paradigms'],
+                                                     analysis['worklog'],
+                                                     analysis['rules'],
+                                                     analysis['readjustments'],
+                                                     filenames=log_files)
         else:
             self.sections['LOG'] = ''
 
     def __repr__(self):
         return f'{self.__class__.__name__}({self.analysis!r})'
 
+    def section(self, name):
+        """Return the LaTeX source of the section (rendering it if it is lazy)."""
+        with tools.mapper(self.workers) as mapper:
+            return ''.join(self.iterchunks(name, mapper=mapper))
+
+    def iterchunks(self, name, *, mapper=map):
+        """Yield the LaTeX source of the section in chunks (rendering it if it is lazy)."""
+        section = self.sections[name]
+        if callable(section):
+            yield from section(mapper=mapper)
+        else:
+            yield section
+
+    def iterdocument(self, template, *, mapper=map, pattern=string.Template.pattern):
+        """Yield template in chunks with its $placeholders substituted by the sections.
+
+        Like string.Template.safe_substitute(), unknown placeholders are kept as is.
+        """
+        pos = 0
+        for ma in pattern.finditer(template):
+            yield template[pos:ma.start()]
+            pos = ma.end()
+            name = ma.group('named') or ma.group('braced')
+            if name in self.sections:
+                yield from self.iterchunks(name, mapper=mapper)
+            elif ma.group('escaped') is not None:
+                yield string.Template.delimiter
+            else:
+                yield ma.group()
+        yield template[pos:]
+
     def save(self, *, encoding='utf-8', newline=''):
+        """Write the LaTeX document, rendering the lazy sections straight into the file."""
         log.info(f'\tsave to {self.filename!r}..')
         with open(self.template, encoding=encoding) as fd:
             template = fd.read()
 
-        template = string.Template(template)
-        document = template.safe_substitute(self.sections)
-
-        with open(self.filename, 'w', encoding=encoding, newline=newline) as fd:
-            fd.write(document)
+        with tools.mapper(self.workers) as mapper:
+            with open(self.filename, 'w', encoding=encoding, newline=newline) as fd:
+                fd.writelines(self.iterdocument(template, mapper=mapper))
 
     def render(self, *, view=False):
         log.info(f'\trender to {self.pdfname!r}..')
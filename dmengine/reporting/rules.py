@@ -9,10 +9,10 @@ from .features import render_features
 MAP: dict[str, Callable[..., Any]] = {}
 
 
-def render_rules(rules):
+def render_rules(rules, *, numbers):
     if not rules:
         return ''
-    example_refs = (render_example(MAP[r['kind']](r), labelize=True)
+    example_refs = (render_example(MAP[r['kind']](r), numbers=numbers)
                     for r in rules)
     examples, refs = zip(*example_refs)
     for r, ref in zip(rules, refs):
@@ -1,10 +1,11 @@
 from collections.abc import Iterator
+import concurrent.futures
 import contextlib
 from itertools import zip_longest
 import os
 import sys
 
-__all__ = ['grouper', 'swapext', 'chdir', 'current_path']
+__all__ = ['grouper', 'swapext', 'mapper', 'chdir', 'current_path']
 
 
 def grouper(n, iterable, *, fillvalue=None):
@@ -16,6 +17,17 @@ def swapext(filename, extension, *, delimiter: str = '.'):
     return f'{f_name}{f_delim}{extension}'
 
 
+@contextlib.contextmanager
+def mapper(workers=None):
+    """Yield a map function, mapping in a pool of workers processes if workers > 1."""
+    if workers is None or workers <= 1:
+        yield map
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+        yield pool.map
+
+
 @contextlib.contextmanager
 def chdir(path: os.PathLike[str] | str) -> Iterator[str | None]:
     """Change the current working directory, restore on context exit."""
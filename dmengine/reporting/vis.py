@@ -20,8 +20,8 @@ def render_vi(vi, *, tmpl=VI):
     return tmpl % (exponent, features, context)
 
 
-def render_vis(vis):
-    example_refs = (render_example(render_vi(vi), labelize=True)
+def render_vis(vis, *, numbers):
+    example_refs = (render_example(render_vi(vi), numbers=numbers)
                     for vi in vis)
     examples, refs = zip(*example_refs)
     for vi, ref in zip(vis, refs):
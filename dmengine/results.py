@@ -0,0 +1,125 @@
+"""Save and load analysis results: YAML document, JSON lines, or MessagePack records."""
+
+import collections
+import functools
+import json
+
+try:
+    import msgpack  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+from . import meta
+
+__all__ = ['ResultsFormat', 'load']
+
+
+class ResultsFormat(metaclass=meta.FactoryMeta('format')):  # type: ignore[metaclass]  # noqa: E501
+    """Results file format for the head of the results and the worklog entries."""
+
+    extension: str | None = None
+
+    binary = False
+
+    @classmethod
+    def from_filename(cls, filename):
+        """Return the format with the extension of filename (default: YAML)."""
+        for subclass in cls.subclasses.values():
+            if filename.endswith(f'.{subclass.extension}'):
+                return subclass()
+        return cls('yaml')
+
+    def open(self, filename, mode='r', *, encoding='utf-8', newline=''):
+        if self.binary:
+            return open(filename, mode + 'b')
+        return open(filename, mode, encoding=encoding, newline=newline)
+
+    def dump(self, head, worklog, fd, *, anchored=()):
+        """Write the head mapping and the worklog entries to fd."""
+        with self.writer(fd, head, anchored=anchored) as writer:
+            for entry in worklog:
+                writer.write(entry)
+
+    def writer(self, fd, head, *, anchored=()):
+        """Return a context manager writing head on entering, write() an entry to fd."""
+        raise NotImplementedError
+
+    def load(self, fd):
+        """Return the head mapping of the results in fd with its worklog entries."""
+        raise NotImplementedError
+
+
+class Yaml(ResultsFormat):
+    """Single YAML document mapping with the worklog sequence as last value."""
+
+    format = extension = 'yaml'
+
+    def dump(self, head, worklog, fd, *, anchored=()):
+        data = collections.OrderedDict(head)
+        data['worklog'] = worklog
+        meta.dump(data, fd)
+
+    def writer(self, fd, head, *, anchored=()):
+        return meta.MappingStream(fd, head, 'worklog', anchored=anchored)
+
+    def load(self, fd):
+        return meta.load(fd)
+
+
+class Records(ResultsFormat):
+    """Header record with the head, one record per worklog entry (see meta.PlainStream)."""
+
+    def writer(self, fd, head, *, anchored=()):
+        return meta.PlainStream(functools.partial(self.write_record, fd), head, 'worklog',
+                                anchored=anchored)
+
+    def load(self, fd):
+        records = self.read_records(fd)
+        anchors = {}
+        data = meta.resolve_aliases(next(records), anchors)
+        data['worklog'] = [meta.resolve_aliases(r, dict(anchors)) for r in records]
+        return data
+
+    def write_record(self, fd, record):
+        raise NotImplementedError
+
+    def read_records(self, fd):
+        raise NotImplementedError
+
+
+class Jsonl(Records):
+    """JSON lines: one JSON object per line."""
+
+    format = extension = 'jsonl'
+
+    def write_record(self, fd, record):
+        fd.write(json.dumps(record, ensure_ascii=False))
+        fd.write('\n')
+
+    def read_records(self, fd):
+        return map(json.loads, fd)
+
+
+class Msgpack(Records):
+    """MessagePack: concatenated binary records (requires msgpack)."""
+
+    format = extension = 'msgpack'
+
+    binary = True
+
+    def __init__(self):
+        if msgpack is None:
+            raise ImportError(f'{self.__class__.__name__} requires msgpack')
+
+    def write_record(self, fd, record):
+        fd.write(msgpack.packb(record))
+
+    def read_records(self, fd):
+        return iter(msgpack.Unpacker(fd, raw=False))
+
+
+def load(filename, *, encoding='utf-8'):
+    """Return the results from filename in the format given by its extension."""
+    format_ = ResultsFormat.from_filename(filename)
+    with format_.open(filename, encoding=encoding) as fd:
+        return format_.load(fd)
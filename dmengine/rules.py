@@ -4,13 +4,13 @@ Impoverishment, Obliteration, Fission, Fusion, CopyHead, AddFeatures, Metathesis
 """
 
 import collections
+import functools
 from itertools import chain, islice
 import operator
 
 from . import contexts
 from . import features
 from . import meta
-from . import tools
 from . import types
 
 __all__ = ['Rule', 'Rules']
@@ -18,7 +18,11 @@ __all__ = ['Rule', 'Rules']
 
 @meta.serializable
 class Rule(metaclass=meta.FactoryMeta('kind')):  # type: ignore[metaclass]  # noqa: E501
-    """Abtstract base class and factory for operations on a sequence of slots containing heads."""
+    """Abtstract base class and factory for operations on a sequence of slots containing heads.
+
+    Heads are shared between the slots before and after a rule: replace a head
+    by a copy in its slot before changing it.
+    """
 
     Features = features.FeatureSet
     Contexts = contexts.Contexts
@@ -47,12 +51,25 @@ class Rule(metaclass=meta.FactoryMeta('kind')):  # type: ignore[metaclass]  # no
                 for o_h, other_head in enumerate(other_slot):
                     yield i_s, i_h, head, o_s, o_h, other_head
 
+    @functools.cached_property
+    def signature(self):
+        """Features required to be present on some head for the rule to apply."""
+        return self.signature_of(f for _, f in self.contexts.items())
+
+    def signature_of(self, featuresets):
+        """Return the features of featuresets once each (present is a union over all heads)."""
+        features_cls = self.system.bind(self.Features)
+        return features_cls(list(dict.fromkeys(v for f in featuresets for v in f.values)))
+
+    def possible(self, present):
+        """Return whether the rule can apply given the union of features present."""
+        return self.signature.issubset(present)
+
     def all_contexts_match(self, slots):
-        for (i_s, (slot, left, right)) in enumerate(tools.curr_pred_succ(slots)):
-            for (i_h, (head, up)) in enumerate(tools.curr_other(slot)):
-                matching = operator.methodcaller('match', head, left, right, up)
-                if all(map(matching, self.contexts)):
-                    yield i_s, i_h, slot, head
+        for position in contexts.HeadPosition.iterslots(slots):
+            matching = operator.methodcaller('match', position)
+            if all(map(matching, self.contexts)):
+                yield position.i_s, position.i_h, position.slot, position.head
 
     def __call__(self, slots):
         raise NotImplementedError
@@ -69,9 +86,10 @@ class Impoverishment(Rule):
 
     kind = 'impoverishment'
 
-    def __init__(self, features, **kwcontexts):
-        self.features = self.Features(features)
-        self.contexts = self.Contexts(**kwcontexts)
+    def __init__(self, features, *, system, **kwcontexts):
+        self.system = system
+        self.features = system.bind(self.Features)(features)
+        self.contexts = self.Contexts(system=system, **kwcontexts)
         if not self.features:
             raise ValueError(f'{self!r} empty features.')
 
@@ -83,10 +101,14 @@ class Impoverishment(Rule):
     def __str__(self):
         return f'{self.features} -> 0{self.contexts}'
 
+    def possible(self, present):
+        return super().possible(present) and self.features.hascommon(present)
+
     def __call__(self, slots):
         applied = False
         for i_s, i_h, slot, head in self.all_contexts_match(slots):
             if head.hascommon(self.features):
+                head = slot[i_h] = head.copy()
                 head.remove(self.features, discard=True)
                 applied = True
         return applied
@@ -97,8 +119,9 @@ class Obliteration(Rule):
 
     kind = 'obliteration'
 
-    def __init__(self, **kwcontexts):
-        self.contexts = self.Contexts(**kwcontexts)
+    def __init__(self, *, system, **kwcontexts):
+        self.system = system
+        self.contexts = self.Contexts(system=system, **kwcontexts)
         if not self.contexts:
             raise ValueError(f'{self!r} no context.')
 
@@ -123,9 +146,11 @@ class Fission(Rule):
 
     kind = 'fission'
 
-    def __init__(self, features, this_head):
-        self.this_head = self.Features(this_head)
-        self.features = self.Features(features)
+    def __init__(self, features, this_head, *, system):
+        self.system = system
+        features_cls = system.bind(self.Features)
+        self.this_head = features_cls(this_head)
+        self.features = features_cls(features)
         if not (self.features and self.this_head):
             raise ValueError(f'{self!r} empty features or this head.')
 
@@ -138,9 +163,14 @@ class Fission(Rule):
         return (f'[{self.features},{self.this_head}...] ->'
                 f' [{self.this_head}...][{self.features}]')
 
+    @functools.cached_property
+    def signature(self):
+        return self.system.bind(self.Features)([])
+
     def __call__(self, slots):
         for i_s, i_h, slot, head in self.loop_heads(slots):
             if head.issubset(self.this_head) and head.issubset(self.features):
+                head = slot[i_h] = head.copy()
                 head.remove(self.features)
                 new_slot = slot.__class__([head.__class__(self.features)])
                 slots.insert(i_s + 1, new_slot)
@@ -153,9 +183,11 @@ class Fusion(Rule):
 
     kind = 'fusion'
 
-    def __init__(self, first_head, second_head, *, into_first=True):
-        self.first_head = self.Features(first_head)
-        self.second_head = self.Features(second_head)
+    def __init__(self, first_head, second_head, *, into_first=True, system):
+        self.system = system
+        features_cls = system.bind(self.Features)
+        self.first_head = features_cls(first_head)
+        self.second_head = features_cls(second_head)
         self.into_first = into_first
         if not (self.first_head and self.second_head):
             raise ValueError(f'{self!r} empty first or second head.')
@@ -173,6 +205,10 @@ class Fusion(Rule):
         tmpl += '[[%s][%s]]...' if self.into_first else '...[[%s][%s]]'
         return tmpl % ((self.first_head, self.second_head) * 2)
 
+    @functools.cached_property
+    def signature(self):
+        return self.signature_of([self.first_head, self.second_head])
+
     def __call__(self, slots):
         for i_s, i_h, head, o_s, o_h, other_head in self.two_candidates(slots):
             if self.first_head.issubset(head) and self.second_head.issubset(other_head):
@@ -189,8 +225,9 @@ class CopyHead(Rule):
 
     kind = 'copy'
 
-    def __init__(self, **kwcontexts):
-        self.contexts = self.Contexts(**kwcontexts)
+    def __init__(self, *, system, **kwcontexts):
+        self.system = system
+        self.contexts = self.Contexts(system=system, **kwcontexts)
         if not self.contexts:
             raise ValueError(f'{self!r} no context.')
 
@@ -214,9 +251,10 @@ class AddFeatures(Rule):
 
     kind = 'add'
 
-    def __init__(self, features, **kwcontexts):
-        self.features = self.Features(features)
-        self.contexts = self.Contexts(**kwcontexts)
+    def __init__(self, features, *, system, **kwcontexts):
+        self.system = system
+        self.features = system.bind(self.Features)(features)
+        self.contexts = self.Contexts(system=system, **kwcontexts)
         if not self.contexts:
             raise ValueError(f'{self!r} no context.')
 
@@ -230,6 +268,7 @@ class AddFeatures(Rule):
 
     def __call__(self, slots):
         for i_s, i_h, slot, head in self.all_contexts_match(slots):
+            head = slot[i_h] = head.copy()
             head.add(self.features)
             return True
         return False
@@ -240,9 +279,11 @@ class Metathesis(Rule):
 
     kind = 'metathesis'
 
-    def __init__(self, first_head, second_head):
-        self.first_head = self.Features(first_head)
-        self.second_head = self.Features(second_head)
+    def __init__(self, first_head, second_head, *, system):
+        self.system = system
+        features_cls = system.bind(self.Features)
+        self.first_head = features_cls(first_head)
+        self.second_head = features_cls(second_head)
         if not (self.first_head and self.second_head):
             raise ValueError(f'{self!r} empty first or second head.')
 
@@ -255,6 +296,10 @@ class Metathesis(Rule):
         return (f'[{self.first_head}]...[{self.second_head}] ->'
                 f' [{self.second_head}]...[{self.first_head}]')
 
+    @functools.cached_property
+    def signature(self):
+        return self.signature_of([self.first_head, self.second_head])
+
     def __call__(self, slots):
         for i_s, i_h, head, o_s, o_h, other_head in self.two_candidates(slots):
             if self.first_head.issubset(head) and self.second_head.issubset(other_head):
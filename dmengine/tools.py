@@ -1,9 +1,9 @@
 """Generic re-useable functions."""
 
-from collections.abc import Sequence
+import glob
 import os
 
-__all__ = ['uniqued', 'curr_pred_succ', 'curr_other', 'derive_filename']
+__all__ = ['uniqued', 'conjunction', 'expand_globs', 'derive_filename']
 
 
 def uniqued(iterable):
@@ -12,18 +12,22 @@ def uniqued(iterable):
     return [i for i in iterable if i not in seen and not add(i)]
 
 
-def curr_pred_succ(iterable):
-    if not isinstance(iterable, Sequence):
-        iterable = tuple(iterable)
-    for i, item in enumerate(iterable):
-        yield item, iterable[:i], iterable[i + 1:]
+def conjunction(predicates):
+    """Return a function true if all predicates are true for its argument (in order)."""
+    first, *rest = predicates
+    if not rest:
+        return first
+    other = conjunction(rest)
+    return lambda arg: first(arg) and other(arg)
 
 
-def curr_other(iterable):
-    if not isinstance(iterable, Sequence):
-        iterable = tuple(iterable)
-    for i, item in enumerate(iterable):
-        yield item, iterable[:i] + iterable[i + 1:]
+def expand_globs(patterns):
+    """Return the sorted matches of each glob pattern (others as given), without repeats."""
+    filenames = []
+    for p in patterns:
+        matches = sorted(glob.glob(p)) if glob.escape(p) != p else []
+        filenames.extend(matches if matches else [p])
+    return uniqued(filenames)
 
 
 def derive_filename(filename, *, suffix=None, extension=None, directory=None):
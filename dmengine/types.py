@@ -39,13 +39,13 @@ class FlowList(List):
 
 
 class Instances(List):
-    """List of instances created applying **kwargs to factory function."""
+    """List of instances created applying **kwargs (and common **kwargs) to factory function."""
 
     new_item: type
 
-    def __init__(self, items_kwargs=()):
+    def __init__(self, items_kwargs=(), **common):
         new_item = self.new_item
-        items = (new_item(**kwargs) for kwargs in items_kwargs)
+        items = (new_item(**kwargs, **common) for kwargs in items_kwargs)
         super().__init__(items)
 
     def __repr__(self):
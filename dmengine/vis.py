@@ -2,9 +2,15 @@
 
 import collections
 import functools
-from itertools import groupby
+import heapq
+from itertools import chain, groupby
 import operator
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore[assignment]
+
 from . import contexts
 from . import exponents
 from . import features
@@ -12,7 +18,9 @@ from . import meta
 from . import tools
 from . import types
 
-__all__ = ['VocabularyItem', 'VocabularyItems', 'ViList']
+__all__ = ['VocabularyItem', 'VocabularyItems',
+           'ViMatcher', 'ViFilter', 'ViIndex', 'ViTree', 'ViMatrix',
+           'ViList']
 
 
 @meta.serializable
@@ -32,10 +40,10 @@ class VocabularyItem(object):
         result.update(self.contexts.items())
         return dumper.represent_mapping('tag:yaml.org,2002:map', result.items())
 
-    def __init__(self, exponent, features, **kwcontexts):
+    def __init__(self, exponent, features, *, system, **kwcontexts):
         self.exponent = self.Exponent(exponent)
-        self.features = self.Features(features)
-        self.contexts = self.Contexts(**kwcontexts)
+        self.features = system.bind(self.Features)(features)
+        self.contexts = self.Contexts(system=system, **kwcontexts)
         if not self.features:
             raise ValueError(f'{self!r} empty features.')
 
@@ -43,7 +51,7 @@ class VocabularyItem(object):
         exponent = self.exponent.copy(form=form)
         features = self.features.values
         contexts = {ctx.scope: ctx.features.values for ctx in self.contexts}
-        return self.__class__(exponent, features, **contexts)
+        return self.__class__(exponent, features, system=self.features.system, **contexts)
 
     def __repr__(self):
         contexts = self.contexts._kwstr()
@@ -54,12 +62,23 @@ class VocabularyItem(object):
     def __str__(self):
         return f'{self.exponent} <-> {self.features}{self.contexts}'
 
-    def match(self, head, left_context, right_context, up_context):
-        matching = operator.methodcaller('match', head,
-                                         left_context, right_context,
-                                         up_context)
-        return (self.features.issubset_visible(head)
-                and all(map(matching, self.contexts)))
+    rank = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('predicate', None)
+        return state
+
+    def match(self, position):
+        return self.predicate(position)
+
+    @functools.cached_property
+    def predicate(self):
+        """Compiled match: the visible head features first, then the contexts by cost."""
+        test = self.features.subset_test(visible=True)
+        ctxs = sorted(self.contexts, key=operator.attrgetter('cost'))
+        return tools.conjunction([lambda position: test(position.head)]
+                                 + [c.compile() for c in ctxs])
 
     @functools.cached_property
     def specificity(self):
@@ -72,22 +91,222 @@ class VocabularyItems(types.Instances):
 
     new_item = VocabularyItem
 
+    def __init__(self, items_kwargs=(), *, system):
+        super().__init__(items_kwargs, system=system)
+        ranked = sorted(self, key=ViList.sortkey, reverse=True)
+        for rank, vi in enumerate(ranked):
+            vi.rank = rank
+
+    def compile(self, matcher='index'):
+        """Return the matching engine of the given kind for these vis."""
+        return ViMatcher(matcher, self)
+
     def filter(self, predicate=None):
         return ViList(filter(predicate, self) if predicate is not None else self)
 
-    def matching(self, head, left_context, right_context, up_context):
-        matching = operator.methodcaller('match', head,
-                                         left_context, right_context,
-                                         up_context)
+    def matching(self, position):
+        matching = operator.methodcaller('match', position)
         return self.filter(matching)
 
     # TODO: finish this
-    def matching_(self, slot, left_context, right_context):
-        return Matching((head, vi)
-            for head, up_context in tools.curr_other(slot)
-            for vi in filter(
-                operator.methodcaller('match', head, left_context, right_context, up_context),
-                self))
+    def matching_(self, slots, i_s, all_features=None):
+        return Matching((position.head, vi)
+            for position in contexts.HeadPosition.iterslot(slots, i_s, all_features)
+            for vi in filter(operator.methodcaller('match', position), self))
+
+
+class ViMatcher(metaclass=meta.FactoryMeta('kind')):  # type: ignore[metaclass]  # noqa: E501
+    """Abstract base class and factory for engines matching vocabulary items against heads.
+
+    Subclasses produce the candidates for a head ordered by the rank (specificity
+    order) of the vis, the candidates are then filtered by their compiled predicate.
+    """
+
+    def __init__(self, vis):
+        self.vis = vis
+
+    def prepare(self, heads):
+        """Hook for engines computing the candidates of many heads at once."""
+
+    def candidates(self, head):
+        raise NotImplementedError
+
+    def matching(self, position):
+        return ViList(vi for vi in self.candidates(position.head) if vi.predicate(position))
+
+    def matching_(self, slots, i_s, all_features=None):
+        return Matching((position.head, vi)
+            for position in contexts.HeadPosition.iterslot(slots, i_s, all_features)
+            for vi in self.matching(position))
+
+
+class ViFilter(ViMatcher):
+    """Linear filter: all vocabulary items are candidates."""
+
+    kind = 'linear'
+
+    def __init__(self, vis):
+        super().__init__(vis)
+        self.ranked = sorted(vis, key=operator.attrgetter('rank'))
+
+    def candidates(self, head):
+        return self.ranked
+
+
+class ViIndex(ViMatcher):
+    """Inverted index from required head features to vocabulary items for candidate pruning.
+
+    Each vi is filed under its rarest required (scope, value): either one of its
+    features (required visible on the head) or one of its this_head context
+    features (required on the head). Only the vis filed under the head's
+    (visible) values are candidates, the others cannot match.
+    """
+
+    kind = 'index'
+
+    scopes = {'features': 'values_visible', 'this_head': 'values'}
+
+    def __init__(self, vis):
+        super().__init__(vis)
+
+        required = [list(self.required(vi)) for vi in vis]
+        counts = collections.Counter(k for keys in required for k in keys)
+
+        self.buckets = collections.defaultdict(list)
+        for vi, keys in zip(vis, required):
+            key = min(keys, key=counts.__getitem__)
+            self.buckets[key].append((vi.rank, vi))
+        for bucket in self.buckets.values():
+            bucket.sort(key=operator.itemgetter(0))
+
+    def required(self, vi):
+        for scope, featureset in chain([('features', vi.features)], vi.contexts.items()):
+            if scope in self.scopes:
+                for value in featureset.values:
+                    yield scope, value
+
+    def candidates(self, head):
+        keys = {(scope, value) for scope, attr in self.scopes.items()
+                for value in getattr(head, attr)}
+        buckets = (self.buckets[k] for k in keys if k in self.buckets)
+        return [vi for _, vi in heapq.merge(*buckets)]
+
+
+class ViTree(ViMatcher):
+    """Discrimination tree of vocabulary items keyed on their features in system index order.
+
+    Each vi is filed at the node reached by the indexes of its features (sorted).
+    A walk along the sorted indexes of the head's visible features only visits
+    the nodes whose path is among them, so it collects exactly the vis whose
+    features are visible on the head (with work proportional to the matches).
+    """
+
+    kind = 'tree'
+
+    class Node(object):
+
+        __slots__ = ('children', 'items')
+
+        def __init__(self):
+            self.children = {}
+            self.items = []
+
+    def __init__(self, vis):
+        super().__init__(vis)
+
+        self.root = self.Node()
+        for vi in vis:
+            node = self.root
+            for index in vi.features.indexes():
+                child = node.children.get(index)
+                if child is None:
+                    child = node.children[index] = self.Node()
+                node = child
+            node.items.append((vi.rank, vi))
+
+    def candidates(self, head):
+        indexes = head.indexes(visible=True)
+        found = []
+        stack = [(self.root, 0)]
+        while stack:
+            node, start = stack.pop()
+            found.extend(node.items)
+            children = node.children
+            if children:
+                previous = None
+                for i in range(start, len(indexes)):
+                    index = indexes[i]
+                    if index != previous and index in children:
+                        stack.append((children[index], i + 1))
+                    previous = index
+        found.sort(key=operator.itemgetter(0))
+        return [vi for _, vi in found]
+
+
+class ViMatrix(ViMatcher):
+    """Subset tests of head features against all vocabulary items as one matrix product.
+
+    Each column stands for the n-th occurrence of a feature required by some vi,
+    a vi is a candidate for a head if none of its columns are missing from the
+    visible features of the head. prepare() computes the candidates of many
+    heads in chunks, they are cached by head features (requires NumPy).
+    """
+
+    kind = 'numpy'
+
+    chunksize = 4096
+
+    def __init__(self, vis):
+        if numpy is None:
+            raise ImportError(f'{self.__class__.__name__} requires NumPy')
+        super().__init__(vis)
+
+        self.ranked = sorted(vis, key=operator.attrgetter('rank'))
+        required = [self.columns(vi.features) for vi in self.ranked]
+        self.column = {c: i for i, c in enumerate(sorted(set(chain.from_iterable(required))))}
+
+        self.required = numpy.zeros((len(self.ranked), len(self.column)), dtype=numpy.float32)
+        for row, columns in enumerate(required):
+            self.required[row, [self.column[c] for c in columns]] = 1
+
+        self.cache = {}
+
+    @staticmethod
+    def columns(features, *, visible=False):
+        seen = collections.Counter()
+        result = []
+        for index in features.indexes(visible=visible):
+            seen[index] += 1
+            result.append((index, seen[index]))
+        return result
+
+    @staticmethod
+    def key(head):
+        return isinstance(head, features.FeatureBag), head.bits, head.hidden
+
+    def prepare(self, heads):
+        todo = {}
+        for head in heads:
+            key = self.key(head)
+            if key not in self.cache and key not in todo:
+                todo[key] = head
+        todo = list(todo.items())
+
+        for start in range(0, len(todo), self.chunksize):
+            chunk = todo[start:start + self.chunksize]
+            present = numpy.zeros((len(chunk), len(self.column)), dtype=numpy.float32)
+            for row, (_, head) in enumerate(chunk):
+                columns = self.columns(head, visible=True)
+                present[row, [self.column[c] for c in columns if c in self.column]] = 1
+            missing = (1 - present) @ self.required.T
+            for (key, _), matches in zip(chunk, missing == 0):
+                self.cache[key] = [self.ranked[i] for i in numpy.flatnonzero(matches)]
+
+    def candidates(self, head):
+        key = self.key(head)
+        if key not in self.cache:
+            self.prepare([head])
+        return self.cache[key]
 
 
 class ViList(types.List):
@@ -103,6 +322,12 @@ class ViList(types.List):
     def sort(self, *, key=sortkey, reverse=True):
         super().sort(key=key, reverse=reverse)
 
+    def remaining(self, head, consumed):
+        """Return the vis still matching head after consumed (re-check those sharing features)."""
+        return self.__class__(vi for vi in self
+                              if not vi.features.hascommon(consumed)
+                              or vi.features.issubset_visible(head))
+
     def by_specificty(self, *, sortkey=sortkey, reverse=True):
         vis = sorted(self, key=sortkey, reverse=reverse)
         return [self.__class__(g) for k, g in groupby(vis, sortkey)]
@@ -0,0 +1,72 @@
+"""Recalculate an analysis whenever its config file changes."""
+
+import logging
+import os
+import time
+
+from .analysis import Analysis
+from .reporting import Report
+
+__all__ = ['Watcher']
+
+
+log = logging.getLogger()
+
+
+class Watcher(object):
+    """Keep an analysis in memory, recalculate and save it when its config file changes."""
+
+    Analysis = Analysis
+
+    Report = Report
+
+    def __init__(self, filename, *, directory=None, workers=None, cache=None,
+                 format='yaml', report=False, split_log=False, pdf=False, interval=1.0):
+        self.analysis = self.Analysis(filename, directory=directory, workers=workers,
+                                      cache=cache, format=format)
+        self.workers = workers
+        self.report = report or pdf
+        self.split_log = split_log
+        self.pdf = pdf
+        self.interval = interval
+
+        self.mtime = self.stat()
+        self.update(self.analysis.calculate)
+
+    def stat(self):
+        try:
+            return os.stat(self.analysis.filename).st_mtime_ns
+        except FileNotFoundError:  # editor replacing the file
+            return None
+
+    def update(self, recalculate):
+        result = recalculate()
+        self.analysis.save()
+
+        if self.report:
+            report = self.Report(self.analysis, workers=self.workers,
+                                 split_log=self.split_log)
+            report.save()
+            if self.pdf:
+                report.render()
+
+        return result
+
+    def poll(self):
+        """Recalculate if the config file changed, return the changed keys (or None)."""
+        mtime = self.stat()
+        if mtime is None or mtime == self.mtime:
+            return None
+        self.mtime = mtime
+
+        try:
+            return self.update(self.analysis.reload)
+        except Exception:
+            log.exception(f'{self.analysis.filename!r} failed')
+            return None
+
+    def run(self):
+        log.info(f'watching {self.analysis.filename!r} for changes (Ctrl+C to stop)..')
+        while True:
+            time.sleep(self.interval)
+            self.poll()
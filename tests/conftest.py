@@ -0,0 +1,48 @@
+import pathlib
+
+import pytest
+import yaml
+
+from dmengine import analysis
+
+EXAMPLES = pathlib.Path(__file__).parent.parent / 'examples'
+
+
+@pytest.fixture(scope='session')
+def examples():
+    """Return the directory of the example analyses."""
+    return EXAMPLES
+
+
+@pytest.fixture
+def example_config():
+    """Return a function loading the config of an example analysis as plain data."""
+    def example_config(name='german'):
+        return yaml.safe_load((EXAMPLES / f'{name}.yaml').read_text(encoding='utf-8'))
+    return example_config
+
+
+@pytest.fixture
+def write_config(tmp_path):
+    """Return a function saving a config as tmp_path/<name>.yaml, returning its filename."""
+    def write_config(cfg, name='german'):
+        filename = tmp_path / f'{name}.yaml'
+        filename.write_text(yaml.safe_dump(cfg), encoding='utf-8')
+        return str(filename)
+    return write_config
+
+
+@pytest.fixture
+def calculated(tmp_path):
+    """Return a function creating and calculating an Analysis (results in tmp_path).
+
+    name is an example analysis or the filename of a config file.
+    """
+    def calculated(name='german', *, save=False, directory=tmp_path, **kwargs):
+        filename = name if name.endswith('.yaml') else str(EXAMPLES / f'{name}.yaml')
+        result = analysis.Analysis(filename, directory=directory, **kwargs)
+        result.calculate()
+        if save:
+            result.save()
+        return result
+    return calculated
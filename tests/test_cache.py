@@ -0,0 +1,16 @@
+import yaml
+
+from dmengine import calculation
+from dmengine import meta
+
+
+def test_cache(tmp_path, monkeypatch, calculated):
+    a = calculated('thulung', cache=tmp_path / 'cache')
+    expected = yaml.dump(a.worklog, Dumper=meta.Dumper)
+
+    def calculate(self, input_pre):
+        raise AssertionError('not cached')
+
+    monkeypatch.setattr(calculation.Calculator, 'calculate', calculate)
+    cached = calculated('thulung', cache=tmp_path / 'cache')
+    assert yaml.dump(cached.worklog, Dumper=meta.Dumper) == expected
@@ -0,0 +1,74 @@
+import concurrent.futures
+
+import pytest
+import yaml
+
+from dmengine import analysis
+from dmengine import calculation
+from dmengine import meta
+from dmengine import rules
+
+
+def test_calculate_workers(tmp_path, calculated):
+    results = []
+    for workers in (None, 2):
+        a = calculated(directory=tmp_path / str(workers), workers=workers)
+        results.append(yaml.dump(a.worklog))
+    assert results[0] == results[1]
+
+
+def test_calculate_memoize(monkeypatch, calculated):
+    results = []
+    for memoize in (False, True):
+        monkeypatch.setattr(calculation.Calculator, 'memoize', memoize)
+        results.append(yaml.dump(calculated('thulung').worklog))
+    assert results[0] == results[1]
+
+
+def test_calculate_concurrent(tmp_path, examples, calculated):
+    names = ['german', 'thulung']
+    expected = [yaml.dump(calculated(n).worklog, Dumper=meta.Dumper) for n in names]
+
+    analyses = [analysis.Analysis(str(examples / f'{n}.yaml'), directory=tmp_path)
+                for n in names]
+    with concurrent.futures.ThreadPoolExecutor(len(analyses)) as pool:
+        list(pool.map(analysis.Analysis.calculate, analyses))
+    assert [yaml.dump(a.worklog, Dumper=meta.Dumper) for a in analyses] == expected
+
+
+def test_rules_copy_on_write(tmp_path, examples):
+    a = analysis.Analysis(str(examples / 'thulung.yaml'), directory=tmp_path)
+    calculator = a.calculator
+    key = calculator.input_key
+    full_copies = calculation.Executor(calculator.rules.rules)
+    for input_pre in a.inputs:
+        before = key(input_pre)
+        expected, _ = full_copies(input_pre.copy())
+        entry = calculator.calculate(input_pre)
+        assert key(input_pre) == before
+        assert list(map(key, entry['input_pro'])) == list(map(key, expected))
+        changed = [pro for pre, pro in zip([input_pre] + entry['input_pro'], entry['input_pro'])
+                   if key(pro) != key(pre)]
+        assert len({id(pro) for pro in changed}) == len(changed)
+        assert all(pro is not input_pre for pro in changed)
+
+
+@pytest.mark.parametrize('multisets', [False, True])
+def test_rules_possible(monkeypatch, example_config, write_config, calculated, multisets):
+    cfg = example_config('example')
+    cfg['multisets'] = multisets
+    cfg['vis'] = [{'exponent': 'sleep', 'features': ['V']},
+                  {'exponent': '-pl', 'features': ['+pl']},
+                  {'exponent': '-n', 'features': ['Nom']}]
+    cfg['rules'] = [{'kind': 'impoverishment', 'features': ['+pl'],
+                     'this_head': ['Nom'], 'anywhere': ['Nom']},
+                    {'kind': 'impoverishment', 'features': ['+pl'], 'this_head': ['+2']}]
+    cfg['paradigms'][0]['inputs'] = [[['V'], ['Nom', '+1', '+pl']]]
+    filename = write_config(cfg, 'possible')
+
+    a = calculated(filename)
+    present = a.inputs[0].features()
+    assert [r.possible(present) for r in a.calculator.rules.rules] == [True, False]
+
+    monkeypatch.setattr(rules.Rule, 'possible', lambda self, present: True)
+    assert a.spellouts == calculated(filename).spellouts == ['sleep-n']
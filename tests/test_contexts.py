@@ -0,0 +1,33 @@
+import pytest
+
+from dmengine import contexts
+from dmengine import features
+
+
+@pytest.mark.parametrize('always_bag, added', [(False, '-3'), (True, 'A')])
+def test_slots_features_refreshed(always_bag, added):
+    features_kwargs = [{'value': 'A', 'category': 'case'},
+                       {'value': '+1', 'category': 'person'},
+                       {'value': '-3', 'category': 'person'},
+                       {'value': '+pl', 'category': 'number'}]
+    system = features.FeatureSystem(features_kwargs, always_bag=always_bag)
+    heads = [system.FeatureSet('+1').copy(), system.FeatureSet('+pl').copy()]
+    all_features = contexts.SlotsFeatures([heads[:1], heads[1:]])
+
+    def check():
+        union = heads[0].from_featuresets(heads)
+        result = all_features()
+        assert (result.values, result.bits, result.hidden) == \
+               (union.values, union.bits, union.hidden)
+        assert all_features() is result
+
+    check()
+    heads[0].consume(system.FeatureSet('+1'))
+    check()
+    assert not system.FeatureSet('+1').issubset_visible(all_features())
+    heads[1].add(system.FeatureSet(added))
+    check()
+    assert added in all_features().values
+    heads[0].remove(system.FeatureSet('+1'))
+    check()
+    assert '+1' not in all_features().values
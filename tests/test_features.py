@@ -21,3 +21,62 @@ def fs():
 def test_init(fs):
     assert [(f.value, f.category) for f in fs.FeatureSet('+1 +sg').features] == \
            [('+1', 'person'), ('+sg', 'number')]
+
+
+@pytest.fixture(scope='session')
+def bs():
+    features_kwargs = [{'value': 'A', 'category': 'case'},
+                       {'value': 'P', 'category': 'case'},
+                       {'value': '+1', 'category': 'person'},
+                       {'value': '+pl', 'category': 'number'}]
+    return features.FeatureSystem(features_kwargs, always_bag=True)
+
+
+def test_interned(fs):
+    fset = fs.FeatureSet('+1 +sg')
+    assert fs.FeatureSet(['+sg', '+1']) is fset
+    assert fs.FeatureSet(v for v in ['+sg', '+1']) is fset
+    assert fset.frozen
+    with pytest.raises(TypeError, match=r'frozen'):
+        fset.add(fs.FeatureSet('+pl'))
+    copy = fset.copy()
+    assert copy is not fset and not copy.frozen
+    copy.add(fs.FeatureSet('+pl'))
+    assert copy.values == ['+1', '+sg', '+pl']
+    assert fset.values == ['+1', '+sg']
+
+
+def test_issubset_visible(fs):
+    head = fs.FeatureSet('+1 +sg').copy()
+    vi = fs.FeatureSet('+1')
+    assert vi.issubset_visible(head)
+    head.consume(vi)
+    assert str(head) == '_+1_ +sg'
+    assert head.values_visible == ['+sg']
+    assert not vi.issubset_visible(head)
+    assert vi.issubset(head)
+    with pytest.raises(ValueError):
+        head.consume(vi)
+
+
+def test_add_remove_keeps_order(fs):
+    head = fs.FeatureSet('+2 +pl').copy()
+    head.add(fs.FeatureSet('-1 +pl'))
+    assert head.values == ['+2', '+pl', '-1']
+    head.remove(fs.FeatureSet('+pl -sg'), discard=True)
+    assert head.values == ['+2', '-1']
+    with pytest.raises(KeyError):
+        head.remove(fs.FeatureSet('+sg'))
+
+
+def test_bag_counts(bs):
+    head = bs.FeatureSet('+1 A +1 +pl').copy()
+    assert head.values == ['A', '+1', '+1', '+pl']
+    assert bs.FeatureSet('+1 +1').issubset_visible(head)
+    assert not bs.FeatureSet('+1 +1 +1').issubset(head)
+    head.consume(bs.FeatureSet('+1'))
+    assert str(head) == 'A _+1_ +1 +pl'
+    assert bs.FeatureSet('+1').issubset_visible(head)
+    assert not bs.FeatureSet('+1 +1').issubset_visible(head)
+    assert head.hascommon(bs.FeatureSet('P +pl'))
+    assert not head.hascommon(bs.FeatureSet('P'))
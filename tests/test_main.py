@@ -0,0 +1,29 @@
+import sys
+
+import pytest
+
+import dmengine
+from dmengine import __main__
+
+
+def test_calculate_many(tmp_path, examples):
+    patterns = [str(examples / '*.yaml'), str(tmp_path / 'missing.yaml')]
+    results = list(dmengine.calculate_many(patterns, directory=tmp_path))
+    assert [r.error is None for r in results] == [True] * 4 + [False]
+    assert results[-1].error.startswith('FileNotFoundError')
+    assert (tmp_path / 'german-results.yaml').exists()
+
+
+def test_main(tmp_path, monkeypatch, capsys, examples):
+    args = [str(examples / 'german.yaml'), str(examples / 'thulung.yaml'), str(tmp_path)]
+    monkeypatch.setattr(sys, 'argv', ['dmengine', *args])
+    assert __main__.main() == 0
+    assert capsys.readouterr().out.count('ok ') == 2
+    assert (tmp_path / 'thulung-results.yaml').exists()
+
+
+def test_main_watch_stream(monkeypatch, examples):
+    monkeypatch.setattr(sys, 'argv', ['dmengine', '--watch', '--stream',
+                                      str(examples / 'german.yaml')])
+    with pytest.raises(SystemExit):
+        __main__.main()
@@ -0,0 +1,19 @@
+import io
+
+import yaml
+
+from dmengine import meta
+
+
+def test_dump_libyaml(calculated):
+    a = calculated('thulung')
+
+    class PureDumper(yaml.Dumper):
+
+        def ignore_aliases(self, data):
+            return isinstance(data, meta.Dumper.value_types) or super().ignore_aliases(data)
+
+    data = [a.features, a.vis, a.rules, a.readjustments, a.paradigms, a.worklog]
+    with io.StringIO() as f:
+        meta.dump(data, f)
+        assert f.getvalue() == yaml.dump(data, Dumper=PureDumper)
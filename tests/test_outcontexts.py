@@ -0,0 +1,23 @@
+import pytest
+
+from dmengine import exponents
+from dmengine import outcontexts
+
+
+class Vi(object):
+
+    def __init__(self, exponent):
+        self.exponent = exponents.Exponent(exponent)
+
+
+@pytest.mark.parametrize('scope, exponent, expected', [
+    ('exponent', 'b', [False, True, False]),
+    ('left_exponent', 'a-', [False, True, False]),
+    ('right_exponent', '-c', [False, True, False]),
+    ('other_exponent', 'b', [True, False, True]),
+])
+def test_exponent_contexts(scope, exponent, expected):
+    vis = [Vi('a-'), Vi('b'), Vi('-c')]
+    context = outcontexts.ViContext(scope, exponent)
+    positions = outcontexts.ViPosition.itervis(vis)
+    assert [bool(context.match(p)) for p in positions] == expected
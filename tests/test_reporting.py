@@ -0,0 +1,80 @@
+import pathlib
+import re
+import string
+
+import dmengine
+from dmengine.reporting import backend
+
+
+def test_report_from_analysis(calculated):
+    a = calculated(save=True)
+
+    def sections(report):
+        return {k: report.section(k) for k in report.sections}
+
+    loaded, live = dmengine.Report(a.results), dmengine.Report(a)
+    assert live.filename == loaded.filename
+    assert sections(live) == sections(loaded)
+
+
+def test_report_save_streamed(calculated):
+    a = calculated()
+    report = dmengine.Report(a)
+    report.save()
+
+    with open(report.template, encoding='utf-8') as f:
+        template = f.read()
+    sections = {name: report.section(name) for name in report.sections}
+
+    with open(report.filename, encoding='utf-8') as f:
+        assert f.read() == string.Template(template).safe_substitute(sections)
+
+    template = '$$ $UNKNOWN ${TITLE} $TITLE'
+    expected = string.Template(template).safe_substitute(sections)
+    assert ''.join(report.iterdocument(template)) == expected
+
+
+def test_report_workers_split_log(tmp_path, calculated):
+    a = calculated()
+
+    def document(report):
+        report.save()
+        with open(report.filename, encoding='utf-8') as f:
+            return f.read()
+
+    expected = document(dmengine.Report(a, filename=str(tmp_path / 'expected.tex')))
+    assert document(dmengine.Report(a, filename=str(tmp_path / 'workers.tex'),
+                                    workers=2)) == expected
+
+    split = document(dmengine.Report(a, filename=str(tmp_path / 'split.tex'),
+                                     split_log=True, workers=2))
+    inputs = re.findall(r'\\input\{(split-log\d+)\}', split)
+    assert len(inputs) == len(a.paradigms)
+    for name in inputs:
+        with open(tmp_path / f'{name}.tex', encoding='utf-8') as f:
+            split = split.replace(f'\\input{{{name}}}', f.read()[:-1])
+    assert split == expected
+
+
+def test_pdflatex_compile(tmp_path, monkeypatch):
+    runs = []
+
+    def pdflatex(args):  # same .aux from every run
+        runs.append(args[-1])
+        pathlib.Path('report.aux').write_text('\\relax\n', encoding='ascii')
+        pathlib.Path('report.pdf').touch()
+
+    monkeypatch.setattr(backend.subprocess, 'check_call', pdflatex)
+    (tmp_path / 'report.tex').write_text('\\input{report-log1}\n', encoding='utf-8')
+    (tmp_path / 'report-log1.tex').write_text('log\n', encoding='utf-8')
+    filename = str(tmp_path / 'report.tex')
+
+    backend.pdflatex_compile(filename)
+    assert runs == ['report.tex'] * 2  # until .aux is stable
+
+    backend.pdflatex_compile(filename)
+    assert len(runs) == 2  # unchanged
+
+    (tmp_path / 'report-log1.tex').write_text('changed\n', encoding='utf-8')
+    backend.pdflatex_compile(filename)
+    assert len(runs) == 3
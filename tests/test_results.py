@@ -0,0 +1,50 @@
+import itertools
+
+import pytest
+
+from dmengine import analysis
+from dmengine import meta
+from dmengine import results
+
+
+@pytest.mark.parametrize('workers', [None, 2])
+def test_stream(tmp_path, examples, calculated, workers):
+    saved = calculated('thulung', save=True, directory=tmp_path / 'saved')
+
+    streamed = analysis.Analysis(str(examples / 'thulung.yaml'),
+                                 directory=tmp_path / 'streamed', workers=workers)
+    streamed.stream()
+    assert not hasattr(streamed, 'worklog')
+    assert streamed.spellouts == saved.spellouts
+
+    with open(saved.results, encoding='utf-8') as s, \
+         open(streamed.results, encoding='utf-8') as t:
+        assert meta.load(t) == meta.load(s)
+
+
+@pytest.mark.parametrize('format_', ['jsonl', 'msgpack'])
+@pytest.mark.parametrize('stream', [False, True])
+def test_results_format(tmp_path, examples, calculated, format_, stream):
+    if format_ == 'msgpack':
+        pytest.importorskip('msgpack')
+
+    saved = calculated('thulung', save=True, directory=tmp_path / 'yaml')
+
+    if stream:
+        a = analysis.Analysis(str(examples / 'thulung.yaml'),
+                              directory=tmp_path / format_, format=format_)
+        a.stream()
+    else:
+        a = calculated('thulung', save=True, directory=tmp_path / format_, format=format_)
+    assert a.results.endswith(f'-results.{format_}')
+
+    data, expected = results.load(a.results), results.load(saved.results)
+    assert data == expected
+
+    def shared(data):  # aliased values the report relies on
+        vis = {id(vi) for vi in data['vis']}
+        return [([p is q for p, q in itertools.pairwise([e['input_pre']] + e['input_pro'])],
+                 [id(vi) in vis for vi in e['output_pre']])
+                for e in data['worklog']]
+
+    assert shared(data) == shared(expected)
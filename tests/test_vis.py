@@ -0,0 +1,59 @@
+import pathlib
+
+import pytest
+
+from dmengine import analysis
+from dmengine import contexts
+
+EXAMPLES = sorted(pathlib.Path(__file__).parent.parent.glob('examples/*.yaml'))
+
+
+@pytest.mark.parametrize('matcher', ['linear', 'index', 'tree'])
+@pytest.mark.parametrize('filename', EXAMPLES, ids=lambda p: p.name)
+def test_matcher_matching(tmp_path, filename, matcher):
+    a = analysis.Analysis(str(filename), directory=tmp_path)
+    engine = a.vis.compile(matcher)
+    for slots in a.inputs:
+        for position in contexts.HeadPosition.iterslots(slots):
+            expected = a.vis.matching(position)
+            expected.sort()
+            assert engine.matching(position) == expected
+
+
+@pytest.mark.parametrize('filename', EXAMPLES, ids=lambda p: p.name)
+def test_compiled_predicate(tmp_path, filename):
+    a = analysis.Analysis(str(filename), directory=tmp_path)
+    for slots in a.inputs:
+        for position in contexts.HeadPosition.iterslots(slots):
+            for vi in a.vis:
+                expected = (vi.features.issubset_visible(position.head)
+                            and all(c.match(position) for c in vi.contexts))
+                assert vi.predicate(position) == expected
+
+
+@pytest.mark.parametrize('filename', EXAMPLES, ids=lambda p: p.name)
+def test_matrix_matching(tmp_path, filename):
+    pytest.importorskip('numpy')
+    a = analysis.Analysis(str(filename), directory=tmp_path)
+    engine = a.vis.compile('numpy')
+    engine.prepare(head for slots in a.inputs for slot in slots for head in slot)
+    for slots in a.inputs:
+        for position in contexts.HeadPosition.iterslots(slots):
+            expected = a.vis.matching(position)
+            expected.sort()
+            assert engine.matching(position) == expected
+
+
+@pytest.mark.parametrize('filename', EXAMPLES, ids=lambda p: p.name)
+def test_remaining_after_consume(tmp_path, filename):
+    a = analysis.Analysis(str(filename), directory=tmp_path)
+    engine = a.vis.compile()
+    for slots in a.inputs:
+        slots = slots.copy()
+        for position in contexts.HeadPosition.iterslots(slots):
+            matching = engine.matching(position)
+            while matching:
+                consumed = matching[0].features
+                position.head.consume(consumed)
+                matching = matching.remaining(position.head, consumed)
+                assert matching == engine.matching(position)
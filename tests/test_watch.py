@@ -0,0 +1,75 @@
+import os
+import re
+
+import pytest
+import yaml
+
+from dmengine import meta
+from dmengine import watch
+
+
+def _change_vis(cfg):
+    del cfg['vis'][0]
+
+
+def _change_readjustments(cfg):
+    cfg['readjustments'] = []
+
+
+def _add_paradigm(cfg):
+    paradigm = dict(cfg['paradigms'][0], name='Copy')
+    paradigm['inputs'] = paradigm['inputs'][::-1]
+    cfg['paradigms'].append(paradigm)
+
+
+@pytest.mark.parametrize('change', [_change_vis, _change_readjustments, _add_paradigm])
+def test_reload(example_config, write_config, calculated, change):
+    cfg = example_config()
+    a = calculated(write_config(cfg))
+
+    change(cfg)
+    filename = write_config(cfg)
+    changed = a.reload()
+    assert changed
+
+    dump = lambda a: yaml.dump([a.vis, a.worklog], Dumper=meta.Dumper)  # noqa: E731
+    assert dump(a) == dump(calculated(filename))
+
+
+def test_reload_after_error(example_config, write_config, calculated):
+    cfg = example_config('example')
+    a = calculated(write_config(cfg, 'example'))
+
+    cfg['rules'] = [{'kind': 'impoverishment', 'features': ['+3']}]
+    cfg['readjustments'] = [{'kind': 'transform', 'search': 's', 'replace': r'\9'}]
+    write_config(cfg, 'example')
+    with pytest.raises(re.error):
+        a.reload()
+
+    del cfg['readjustments']
+    filename = write_config(cfg, 'example')
+    a.reload()
+
+    assert a.spellouts == calculated(filename).spellouts
+    assert 'sleep-s' not in a.spellouts
+
+
+def test_watcher_poll(tmp_path, example_config, write_config):
+    cfg = example_config()
+    filename = write_config(cfg)
+    w = watch.Watcher(filename, directory=tmp_path)
+    assert (tmp_path / 'german-results.yaml').exists()
+    assert w.poll() is None
+
+    cfg['title'] = 'Changed'
+    write_config(cfg)
+    os.utime(filename, ns=(w.mtime + 10**9, w.mtime + 10**9))
+    assert w.poll() == {'title'}
+    assert 'title: Changed' in (tmp_path / 'german-results.yaml').read_text(encoding='utf-8')
+
+
+def test_watcher_report_split_log(tmp_path, examples):
+    watch.Watcher(str(examples / 'german.yaml'), directory=tmp_path,
+                  report=True, split_log=True, workers=2)
+    assert (tmp_path / 'german-results.tex').exists()
+    assert (tmp_path / 'german-results-log1.tex').exists()
@@ -16,12 +16,14 @@ PDF = False
 
 print('run', [pathlib.Path(__file__).name] + sys.argv[1:])
 
-for filename in glob.glob(EXAMPLES):
+filenames = sorted(glob.glob(EXAMPLES))
+
+for filename in filenames:
     print('', f'dmengine.calculate({filename!r}, directory={DIRECTORY!r}, pdf={PDF!r})', sep='\n')
     analysis = dmengine.calculate(filename, directory=DIRECTORY, pdf=PDF)
 
-    cmd = [sys.executable, '-m', 'dmengine', filename, DIRECTORY]
-    if PDF:
-        cmd.append('--pdf')
-    print('', f'subprocess.run({cmd!r})', sep='\n')
-    subprocess.run(cmd, check=True)
+cmd = [sys.executable, '-m', 'dmengine', *filenames, DIRECTORY]
+if PDF:
+    cmd.append('--pdf')
+print('', f'subprocess.run({cmd!r})', sep='\n')
+subprocess.run(cmd, check=True)